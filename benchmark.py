@@ -0,0 +1,200 @@
+"""
+End-to-end pipeline benchmark.
+
+Runs crawl → summarize → AI Lab → create_report through the same stage graph
+as main.py, but against recorded HTTP fixtures (src/crawl_fixtures.py), a
+local stub Messages API (src/stub_anthropic.py) and scripted answers for the
+interactive prompts. Reports per-stage and total latency over repeated runs
+and fails when a stage regresses beyond the threshold vs. a stored baseline.
+
+    python benchmark.py --runs 5
+    python benchmark.py --runs 5 --save-baseline
+    python benchmark.py --record   # record real fixtures once (network)
+"""
+from pathlib import Path
+import argparse
+import builtins
+import contextlib
+import io
+import json
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = Path(__file__).parent / "benchmarks"
+FIXTURE_DIR = BENCHMARK_DIR / "fixtures"
+BASELINE_FILE = BENCHMARK_DIR / "baseline.json"
+
+MIN_DELTA = 0.05 # seconds; smaller differences are treated as noise
+
+
+# Answers input() prompts in order (report number, date, news count, article and summary picks)
+class ScriptedInput:
+    def __init__(self, answers: list):
+        self.answers = list(answers)
+
+    def __call__(self, prompt: str = "") -> str:
+        if not self.answers:
+            raise RuntimeError(f"스크립트된 입력이 부족합니다: {prompt!r}")
+        return self.answers.pop(0)
+
+
+# One full pipeline run; returns {stage name: seconds} plus "total"
+def run_once(fixture_dir: Path, answers: list) -> dict:
+    import main
+    from src import history, news_crawler, openai_client
+    from src.crawl_fixtures import replay_fixtures
+    from src.pipeline import run_pipeline
+
+    timings = {}
+    original_input = builtins.input
+    original_output_dir, original_selected = main.OUTPUT_DIR, news_crawler.SELECTED_NEWS_FILE
+    original_history_db = history.HISTORY_DB
+
+    with tempfile.TemporaryDirectory() as tmp:
+        main.OUTPUT_DIR = Path(tmp)
+        news_crawler.SELECTED_NEWS_FILE = Path(tmp) / "selected_news.xlsx"
+        history.HISTORY_DB = Path(tmp) / "reported_news.sqlite3" # every run crawls the same articles
+        openai_client._client_instance = None # rebuild the client against the stub
+        builtins.input = ScriptedInput(answers)
+        try:
+            with replay_fixtures(fixture_dir), contextlib.redirect_stdout(io.StringIO()):
+                start = time.perf_counter()
+                run_pipeline(main.build_stages(), report=False, timings=timings)
+                total = time.perf_counter() - start
+        finally:
+            builtins.input = original_input
+            main.OUTPUT_DIR, news_crawler.SELECTED_NEWS_FILE = original_output_dir, original_selected
+            history.HISTORY_DB = original_history_db
+
+    result = {name: t.duration for name, t in timings.items()}
+    result["total"] = total
+    return result
+
+
+def summarize_runs(runs: list) -> dict:
+    stats = {}
+    for name in runs[0]:
+        values = sorted(run[name] for run in runs)
+        stats[name] = {
+            "median": statistics.median(values),
+            "min": values[0],
+            "max": values[-1],
+        }
+    return stats
+
+
+def print_stats(stats: dict, baseline: dict = None):
+    print("\n" + "="*60)
+    print(f"{'stage':<12} {'median':>9} {'min':>9} {'max':>9} {'baseline':>9}")
+    print("="*60)
+    for name, s in stats.items():
+        base = (baseline or {}).get(name, {}).get("median")
+        base_text = f"{base:8.3f}s" if base is not None else f"{'-':>9}"
+        print(f"{name:<12} {s['median']:8.3f}s {s['min']:8.3f}s {s['max']:8.3f}s {base_text}")
+
+
+# Stages whose median is slower than baseline * (1 + threshold)
+def find_regressions(stats: dict, baseline: dict, threshold: float) -> list:
+    regressions = []
+    for name, s in stats.items():
+        base = baseline.get(name, {}).get("median")
+        if base is None:
+            continue
+        if s["median"] > base * (1 + threshold) and s["median"] - base > MIN_DELTA:
+            regressions.append((name, base, s["median"]))
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AI Weekly Report 엔드투엔드 벤치마크")
+    parser.add_argument("--runs", type=int, default=3, help="반복 실행 횟수")
+    parser.add_argument("--fixtures", type=Path, default=FIXTURE_DIR, help="녹화된 HTTP fixture 디렉토리")
+    parser.add_argument("--record", action="store_true", help="실제 RSS/기사 페이지를 fixture로 녹화 (네트워크 필요)")
+    parser.add_argument("--latency", type=float, default=0.5, help="스텁 API 첫 토큰까지 지연 (초)")
+    parser.add_argument("--tokens-per-sec", type=float, default=80.0, help="스텁 API 출력 속도")
+    parser.add_argument("--rate-limit-every", type=int, default=0, help="N번째 요청마다 429 응답 (0 = 없음)")
+    parser.add_argument("--num-news", type=int, default=4, help="선택할 뉴스 개수")
+    parser.add_argument("--select", default="1 2 3 4", help="스크립트된 기사 선택")
+    parser.add_argument("--choose", default="1 2 3 4", help="스크립트된 요약 선택")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE, help="기준 결과 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준으로 저장")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 판단할 비율 (0.2 = 20%%)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    logging.getLogger("httpx").setLevel(logging.WARNING) # one INFO line per stub request otherwise
+
+    from src.crawl_fixtures import record_fixtures, make_synthetic_fixtures
+    from src.stub_anthropic import StubAnthropicServer, StubConfig
+    from src.telemetry import BENCHMARK_PREFIX, set_run_id
+
+    if args.record:
+        record_fixtures(args.fixtures)
+        print(f"📁 fixture 녹화 완료: {args.fixtures}")
+        return 0
+
+    fixture_dir = args.fixtures
+    synthetic = None
+    if not (fixture_dir / "feeds").exists():
+        synthetic = tempfile.TemporaryDirectory()
+        fixture_dir = Path(synthetic.name)
+        make_synthetic_fixtures(fixture_dir)
+        print("⚠️ 녹화된 fixture가 없어 합성 fixture를 사용합니다 (python benchmark.py --record 로 녹화).")
+
+    answers = ["0", "2025년 1월 1일", str(args.num_news), args.select, args.choose]
+    config = StubConfig(latency=args.latency, tokens_per_sec=args.tokens_per_sec,
+                        rate_limit_every=args.rate_limit_every)
+
+    runs = []
+    bench_id = time.strftime(f"{BENCHMARK_PREFIX}%Y%m%d_%H%M%S")
+    with StubAnthropicServer(config) as server:
+        os.environ["ANTHROPIC_BASE_URL"] = server.base_url
+        os.environ["ANTHROPIC_API_KEY"] = "stub"
+        for i in range(args.runs):
+            # One telemetry run id per run; bench_* is excluded from `main.py telemetry` by default
+            set_run_id(f"{bench_id}_r{i + 1}")
+            result = run_once(fixture_dir, answers)
+            runs.append(result)
+            print(f"  ▶ run {i + 1}/{args.runs}: {result['total']:.2f}s")
+        print(f"  📨 stub API 요청 {server.requests}건 (429 {server.rate_limited}건)")
+
+    if synthetic is not None:
+        synthetic.cleanup()
+
+    stats = summarize_runs(runs)
+    baseline = None
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["stages"]
+    print_stats(stats, baseline)
+
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps({
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "runs": args.runs,
+            "stub": vars(config),
+            "stages": stats,
+        }, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n💾 기준 결과 저장: {args.baseline}")
+        return 0
+
+    if baseline:
+        regressions = find_regressions(stats, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ 성능 회귀 감지 (기준 대비 {args.threshold:.0%} 초과):")
+            for name, base, current in regressions:
+                print(f"   {name}: {base:.3f}s → {current:.3f}s")
+            return 1
+        print(f"\n✅ 기준 대비 회귀 없음 (임계값 {args.threshold:.0%})")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,86 +1,319 @@
-from src.news_crawler import get_selected_news
-from src.news_summarize import summarize_articles
-from src.ppt_maker import create_report
-from src.ailab_summarize import ailab_summarized
-from src.config import PPT_TEMPLATE_FILE, OUTPUT_DIR
+# Heavy modules (pandas, newspaper3k, feedparser, python-pptx, anthropic) are
+# imported inside each stage so that the first prompt appears immediately
+# and subcommands only load what they need.
+from src.config import (PPT_TEMPLATE_FILE, OUTPUT_DIR, EDITIONS_FILE, SEARCH_CATEGORIES_FILE,
+                        ensure_directories, get_ailab_files)
+from src.pipeline import Stage, StageError, run_pipeline
+from src.checkpoint import RunStore, combine_hashes, file_hash
+from src.telemetry import set_run_id
 from datetime import datetime
+from pathlib import Path
+import argparse
+import json
+import shlex
 import sys
 
-def main():
+# ============================================================
+# Pipeline Stages
+# ============================================================
+# Each stage receives the results of finished stages ({stage name: result}).
+# Interactive stages are barrier nodes; the crawl and the AI Lab summary have
+# no dependency on each other and run concurrently.
+
+# 0단계: 보고서 정보 입력 (interactive)
+def stage_report_info(results: dict) -> dict:
+    print("\n" + "="*60)
+    print("📝 0단계: 보고서 정보 입력")
+    print("="*60)
+    number = input("리포트 발행 호수를 입력하세요 (예: 25): ")
+    date = input("리포트 발행 날짜를 입력하세요 (예: 2025년 12월 26일): ")
+
     try:
-        # 0단계: 보고서 정보 입력
-        print("\n" + "="*60)
-        print("📝 0단계: 보고서 정보 입력")
-        print("="*60)
-        number = input("리포트 발행 호수를 입력하세요 (예: 25): ")
-        date = input("리포트 발행 날짜를 입력하세요 (예: 2025년 12월 26일): ")
+        num_input = input("선택할 뉴스 개수를 입력하세요 (기본값: 4): ").strip()
+        num_news = int(num_input) if num_input else 4
+    except ValueError:
+        raise StageError("❌ 잘못된 입력입니다. 숫자를 입력해주세요.")
 
-        ### 1단계: 뉴스 크롤링
-        print("\n" + "="*60)
-        print("📰 STEP 1: News Crawling")
-        print("="*60)
+    if num_news <= 0:
+        raise StageError("❌ 뉴스 개수는 1개 이상이어야 합니다.")
 
-        try:
-            num_input = input("선택할 뉴스 개수를 입력하세요 (기본값: 4): ").strip()
-            num_news = int(num_input) if num_input else 4
+    return {"number": number, "date": date, "num_news": num_news}
 
-            if num_news <= 0:
-                print("❌ 뉴스 개수는 1개 이상이어야 합니다.")
-                return
 
-        except ValueError:
-            print("❌ 잘못된 입력입니다. 숫자를 입력해주세요.")
-            return
+# 1단계: 뉴스 크롤링 (workers > 1: shard 단위로 여러 프로세스 / 머신에서 크롤링)
+def stage_crawl(results: dict, workers: int = 1, queue: Path = None):
+    from src.news_crawler import CrawlerConfig, crawl_news
+    print("\n" + "="*60)
+    print("📰 STEP 1: News Crawling")
+    print("="*60)
+    return crawl_news(CrawlerConfig(workers=workers, queue_db=str(queue or "")))
 
-        selected_news_df = get_selected_news(num_select=num_news)
-        # 사람이 개입해서 num_news 개수만큼 뉴스를 선택
-        if selected_news_df is None or selected_news_df.empty:
-            print("❌ No news selected. END.")
-            return
 
-        # 2단계: 뉴스 요약 (뉴스 크롤링 결과를 전달받아 요약)
-        print("\n" + "="*60)
-        print("🤖 2단계: AI 뉴스 요약")
-        print("="*60)
-        summarized_text = summarize_articles(selected_news_df)
+# 1단계: 기사 사전 평가 (optional) - 작은 모델로 전체 후보의 관련도 점수와 사유를 한 번에 생성
+def stage_prescreen(results: dict):
+    from src.prescreen import prescreen_articles
+    return prescreen_articles(results["crawl"])
 
-        if not summarized_text:
-            print("❌ 요약 생성 실패. 프로세스를 종료합니다.")
-            return
 
-        # 3단계: AI Lab 요약 (별도 소스)
-        print("\n" + "="*60)
-        print("🔬 3단계: AI Lab 뉴스 요약")
-        print("="*60)
-        summarized_text2 = ailab_summarized()
+# Candidates for selection: pre-screened DataFrame when the prescreen stage ran
+def candidate_articles(results: dict):
+    return results["prescreen"] if "prescreen" in results else results["crawl"]
 
-        if not summarized_text2:
-            print("❌ AI Lab 요약 생성 실패. 프로세스를 종료합니다.")
-            return
 
-        # 4단계: PPT 생성
-        print("\n" + "="*60)
-        print("📊 4단계: PPT 보고서 생성")
-        print("="*60)
+# 1단계: 뉴스 선택 (interactive) - 사람이 개입해서 num_news 개수만큼 뉴스를 선택
+def stage_select(results: dict):
+    from src.news_crawler import select_articles
+    selected_news_df = select_articles(candidate_articles(results), num_select=results["info"]["num_news"])
+    if selected_news_df is None or selected_news_df.empty:
+        raise StageError("❌ No news selected. END.")
+    return selected_news_df
+
+
+# 2단계: 뉴스 요약 (뉴스 크롤링 결과를 전달받아 요약)
+def stage_summarize(results: dict) -> list:
+    from src.news_summarize import generate_summaries
+    print("\n" + "="*60)
+    print("🤖 2단계: AI 뉴스 요약")
+    print("="*60)
+    return generate_summaries(results["select"])
+
+
+# 2단계: 요약 선택 (interactive)
+def stage_choose(results: dict) -> str:
+    from src.news_summarize import choose_summaries
+    summarized_text = choose_summaries(results["summarize"])
+    if not summarized_text:
+        raise StageError("❌ 요약 생성 실패. 프로세스를 종료합니다.")
+    return summarized_text
+
+
+# 3단계: AI Lab 요약 (별도 소스)
+def stage_ailab(results: dict) -> str:
+    from src.ailab_summarize import ailab_summarized
+    print("\n" + "="*60)
+    print("🔬 3단계: AI Lab 뉴스 요약")
+    print("="*60)
+    summarized_text2 = ailab_summarized()
+    if not summarized_text2:
+        raise StageError("❌ AI Lab 요약 생성 실패. 프로세스를 종료합니다.")
+    return summarized_text2
+
+
+# 4단계: PPT 생성
+def stage_ppt(results: dict) -> dict:
+    from src.ppt_maker import create_report
+    print("\n" + "="*60)
+    print("📊 4단계: PPT 보고서 생성")
+    print("="*60)
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_filename = OUTPUT_DIR / f"AIWeeklyReport_{timestamp}.pptx"
+
+    create_report(
+        pptx_in=str(PPT_TEMPLATE_FILE),
+        pptx_out=str(output_filename),
+        number=results["info"]["number"],
+        date=results["info"]["date"],
+        text1=results["choose"],
+        text2=results["ailab"]
+    )
+    return {
+        "output": str(output_filename),
+        "template": str(PPT_TEMPLATE_FILE),
+        "number": results["info"]["number"],
+        "date": results["info"]["date"],
+    }
+
+
+# 5단계: 보고서에 실린 기사를 '이미 보도한 기사' 인덱스에 추가 (다음 호 크롤링에서 제외)
+def stage_record_history(results: dict) -> int:
+    from src.history import add_reported, published_rows
+    published = published_rows(results["select"], results["summarize"], results["choose"])
+    count = add_reported(published, issue=results["info"]["number"])
+    print(f"  🗃️ 이미 보도한 기사 인덱스에 {count}개 추가")
+    return count
+
+
+# Fingerprints of external inputs (a changed file invalidates the stage checkpoint on resume)
+def ailab_fingerprint() -> str:
+    return combine_hashes(*(f"{p.name}:{file_hash(p)}" for p in get_ailab_files()))
+
+
+def crawl_fingerprint() -> str:
+    return file_hash(SEARCH_CATEGORIES_FILE)
+
+
+def template_fingerprint() -> str:
+    return file_hash(PPT_TEMPLATE_FILE) if PPT_TEMPLATE_FILE.exists() else ""
+
+
+# ============================================================
+# Batch Mode Stages (headless, e.g. cron)
+# ============================================================
+
+# 1단계: 뉴스 선택 (점수 기준 자동 선택, 카테고리별 할당량)
+def stage_auto_select(results: dict):
+    from src.news_crawler import auto_select_articles
+    info = results["info"]
+    selected_news_df = auto_select_articles(candidate_articles(results), num_select=info["num_news"],
+                                            quotas=info["quotas"])
+    if selected_news_df is None or selected_news_df.empty:
+        raise StageError("❌ No news selected. END.")
+    return selected_news_df
+
+
+# 2단계: 요약 선택 (검증을 통과한 요약 자동 채택)
+def stage_auto_choose(results: dict) -> str:
+    from src.news_summarize import auto_choose_summaries
+    summarized_text = auto_choose_summaries(results["summarize"])
+    if not summarized_text:
+        raise StageError("❌ 요약 생성 실패. 프로세스를 종료합니다.")
+    return summarized_text
+
+
+# Write review files so a human can adjust the automatic picks afterwards
+def write_review_files(results: dict, run_dir: Path) -> dict:
+    import pandas as pd
+    from src.news_summarize import validate_summary
+
+    candidates = candidate_articles(results).drop(columns=["content"], errors="ignore").copy()
+    candidates["selected"] = candidates["link"].isin(results["select"]["link"]).map({True: "Y", False: ""})
+
+    summaries = pd.DataFrame([
+        {
+            "index": item["index"],
+            "title": item["title"],
+            "accepted": "" if validate_summary(item["summary"]) else "Y",
+            "problems": ", ".join(validate_summary(item["summary"])),
+            "summary": item["summary"],
+        }
+        for item in results["summarize"]
+    ])
+
+    review_file = run_dir / "review.xlsx"
+    with pd.ExcelWriter(review_file, engine="openpyxl") as writer:
+        candidates.to_excel(writer, sheet_name="candidates", index=False)
+        summaries.to_excel(writer, sheet_name="summaries", index=False)
+
+    news_file = run_dir / "news_summary.txt"
+    ailab_file = run_dir / "ailab_summary.txt"
+    news_file.write_text(results["choose"], encoding="utf-8")
+    ailab_file.write_text(results["ailab"], encoding="utf-8")
+
+    info = results["info"]
+    print(f"  📝 검토 파일: {review_file}")
+    print("     요약을 수정한 뒤 PPT만 다시 만들려면:")
+    print(f'     python main.py ppt --number {info["number"]} --date "{info["date"]}" '
+          f'--news-summary {news_file} --ailab-summary {ailab_file}')
+
+    return {"review": str(review_file), "news_summary": str(news_file), "ailab_summary": str(ailab_file)}
+
+
+# prescreen: add the optional AI pre-screen stage between crawl and select
+# crawl_workers / crawl_queue: sharded crawl (src/crawl_shards.py)
+def build_stages(batch: dict = None, run_dir: Path = None, prescreen: bool = False,
+                 crawl_workers: int = 1, crawl_queue: Path = None) -> list:
+    candidates = "prescreen" if prescreen else "crawl"
+    extra = [Stage("prescreen", stage_prescreen, deps=["crawl"], label="기사 사전 평가")] if prescreen else []
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_filename = OUTPUT_DIR / f"AIWeeklyReport_{timestamp}.pptx"
+    if batch is None:
+        return [
+            Stage("info", stage_report_info, barrier=True, label="보고서 정보 입력"),
+            Stage("crawl", lambda results: stage_crawl(results, crawl_workers, crawl_queue), deps=["info"],
+                  label="뉴스 크롤링", fingerprint=crawl_fingerprint),
+            Stage("ailab", stage_ailab, label="AI Lab 요약", fingerprint=ailab_fingerprint),
+            *extra,
+            Stage("select", stage_select, deps=["info", candidates], barrier=True, label="뉴스 선택"),
+            Stage("summarize", stage_summarize, deps=["select"], label="뉴스 요약"),
+            Stage("choose", stage_choose, deps=["summarize"], barrier=True, label="요약 선택"),
+            Stage("ppt", stage_ppt, deps=["info", "choose", "ailab"], label="PPT 생성",
+                  fingerprint=template_fingerprint),
+            Stage("history", stage_record_history, deps=["info", "select", "summarize", "choose", "ppt"],
+                  label="보도 기록 저장"),
+        ]
 
-        create_report(
-            pptx_in=str(PPT_TEMPLATE_FILE),
-            pptx_out=str(output_filename),
-            number=number,
-            date=date,
-            text1=summarized_text,
-            text2=summarized_text2
-        )
+    # Batch mode: no interactive stages, so nothing acts as a barrier
+    return [
+        Stage("info", lambda results: dict(batch), label="보고서 정보",
+              fingerprint=lambda: json.dumps(batch, ensure_ascii=False, sort_keys=True)),
+        Stage("crawl", lambda results: stage_crawl(results, crawl_workers, crawl_queue), deps=["info"],
+              label="뉴스 크롤링", fingerprint=crawl_fingerprint),
+        Stage("ailab", stage_ailab, label="AI Lab 요약", fingerprint=ailab_fingerprint),
+        *extra,
+        Stage("select", stage_auto_select, deps=["info", candidates], label="뉴스 자동 선택"),
+        Stage("summarize", stage_summarize, deps=["select"], label="뉴스 요약"),
+        Stage("choose", stage_auto_choose, deps=["summarize"], label="요약 자동 선택"),
+        Stage("ppt", stage_ppt, deps=["info", "choose", "ailab"], label="PPT 생성",
+              fingerprint=template_fingerprint),
+        Stage("history", stage_record_history, deps=["info", "select", "summarize", "choose", "ppt"],
+              label="보도 기록 저장"),
+        Stage("review", lambda results: write_review_files(results, run_dir),
+              deps=["info", "crawl", "select", "summarize", "choose", "ailab"], label="검토 파일 작성"),
+    ]
+
+
+# Command line that resumes this run with the same mode and options
+def resume_command(run_id: str, batch: dict = None, prescreen: bool = False,
+                   crawl_workers: int = 1, crawl_queue: Path = None) -> str:
+    args = ["python", "main.py", "--resume", run_id]
+    if prescreen:
+        args.append("--prescreen")
+    if crawl_workers > 1:
+        args += ["--crawl-workers", str(crawl_workers)]
+    if crawl_queue:
+        args += ["--crawl-queue", str(crawl_queue)]
+    if batch is not None:
+        args += ["batch", "--number", str(batch["number"]), "--date", batch["date"],
+                 "--num-news", str(batch["num_news"])]
+        for category, count in batch["quotas"].items():
+            args += ["--quota", f"{category}={count}"]
+    return shlex.join(args)
+
+
+# resume: run id (or "latest") of a previous run; finished stages with unchanged inputs are skipped
+# batch: {"number", "date", "num_news", "quotas"} to run headless without any input()
+# prescreen: rate all crawled candidates with a small model before the selection
+# crawl_workers / crawl_queue: crawl processes and the shard queue file shared with other machines
+# profile: cProfile + tracemalloc per stage, written to output/runs/<run_id>/profile/
+def main(resume: str = None, batch: dict = None, prescreen: bool = False,
+         crawl_workers: int = 1, crawl_queue: Path = None, profile: bool = False):
+    if not ensure_directories():
+        sys.exit(1)
+
+    try:
+        store = RunStore.open(resume) if resume else RunStore()
+        # A batch run resumed with a plain --resume stays in batch mode (the interactive graph would prompt)
+        if batch is None and store.manifest.get("options", {}).get("batch"):
+            batch = store.manifest["options"]["batch"]
+            print("   배치 모드 실행 기록이므로 배치 모드로 재개합니다.")
+        store.set_option("batch", batch)
+        set_run_id(store.run_id) # Claude call telemetry: output/telemetry/<run_id>.jsonl
+        print(f"🗂️ Run ID: {store.run_id} ({store.run_dir})")
+        print(f"   실패 시 재개: {resume_command(store.run_id, batch, prescreen, crawl_workers, crawl_queue)}")
+
+        profiler = None
+        if profile:
+            from src.profiling import StageProfiler
+            profiler = StageProfiler(store.run_dir / "profile")
+
+        try:
+            results = run_pipeline(build_stages(batch, store.run_dir, prescreen, crawl_workers, crawl_queue),
+                                   store=store, profiler=profiler)
+        finally:
+            if profiler is not None:
+                profiler.write_report() # also for a failed run: the slow stage is often the one that failed
+        output_filename = results["ppt"]["output"]
 
         print("\n" + "="*60)
         print("✅ 모든 프로세스 완료!")
-        print(f"{output_filename} 파일 생성까지 최대 5분정도 소요될 수 있습니다.")
-        print("조금만 기다려주세요... 감사합니다!")
+        print(f"📁 {output_filename} 파일이 생성되었습니다. 감사합니다!")
         print("="*60)
 
+    except StageError as e:
+        print(f"\n{e}")
+        if batch is not None:
+            sys.exit(1) # non-zero exit code for schedulers (cron)
+        return
     except KeyboardInterrupt:
         print("\n\n❌ 사용자에 의해 프로세스가 중단되었습니다.")
         sys.exit(0)
@@ -93,5 +326,150 @@ def main():
         sys.exit(1)
 
 
+# PPT only: build the report from already summarized text files (no crawler / Claude imports)
+def make_ppt_only(number: str, date: str, news_summary: Path, ailab_summary: Path):
+    if not ensure_directories():
+        sys.exit(1)
+
+    try:
+        text1 = Path(news_summary).read_text(encoding="utf-8")
+        text2 = Path(ailab_summary).read_text(encoding="utf-8")
+    except FileNotFoundError as e:
+        print(f"\n❌ 파일을 찾을 수 없습니다: {e}")
+        sys.exit(1)
+
+    from src.ppt_maker import create_report
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_filename = OUTPUT_DIR / f"AIWeeklyReport_{timestamp}.pptx"
+
+    create_report(
+        pptx_in=str(PPT_TEMPLATE_FILE),
+        pptx_out=str(output_filename),
+        number=number,
+        date=date,
+        text1=text1,
+        text2=text2
+    )
+
+
+# Multi-edition: crawl and summarize once, render one report per edition
+def make_editions(number: str, date: str, config: Path, compare_sequential: bool = False):
+    if not ensure_directories():
+        sys.exit(1)
+
+    from src.editions import load_editions, run_editions
+    try:
+        run_editions(load_editions(config), number, date, compare_sequential)
+    except KeyboardInterrupt:
+        print("\n\n❌ 사용자에 의해 프로세스가 중단되었습니다.")
+        sys.exit(0)
+    except FileNotFoundError as e:
+        print(f"\n❌ 파일을 찾을 수 없습니다: {e}")
+        sys.exit(1)
+    except Exception as e:
+        print(f"\n❌ 멀티 에디션 생성 실패: {e}")
+        sys.exit(1)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AI Weekly Report 생성기")
+    parser.add_argument("--resume", metavar="RUN_ID",
+                        help="이전 실행(output/runs/<RUN_ID>, 또는 latest)을 완료된 단계부터 재개")
+    parser.add_argument("--prescreen", action="store_true",
+                        help="선택 전에 작은 모델(claude-haiku-4-5)로 전체 후보의 관련도 점수와 사유를 생성")
+    parser.add_argument("--profile", action="store_true",
+                        help="단계별 cProfile / tracemalloc 프로파일을 output/runs/<RUN_ID>/profile/ 에 저장")
+    parser.add_argument("--crawl-workers", type=int, default=1, metavar="N",
+                        help="크롤링 프로세스 수 (2 이상이면 검색 쿼리를 shard로 나눠 병렬 크롤링)")
+    parser.add_argument("--crawl-queue", type=Path, metavar="DB",
+                        help="shard 작업 큐 파일 (다른 머신과 공유, 기본값: output/cache/crawl_queue.sqlite3)")
+    subparsers = parser.add_subparsers(dest="command")
+
+    subparsers.add_parser("run", help="전체 파이프라인 실행 (기본값)")
+
+    ppt_parser = subparsers.add_parser("ppt", help="요약 텍스트 파일로 PPT만 생성")
+    ppt_parser.add_argument("--number", required=True, help="리포트 발행 호수 (예: 25)")
+    ppt_parser.add_argument("--date", required=True, help="리포트 발행 날짜 (예: 2025년 12월 26일)")
+    ppt_parser.add_argument("--news-summary", type=Path, required=True, help="뉴스 요약 텍스트 파일")
+    ppt_parser.add_argument("--ailab-summary", type=Path, required=True, help="AI Lab 요약 텍스트 파일")
+
+    batch_parser = subparsers.add_parser("batch", help="입력 없이 실행 (점수 기준 자동 선택, cron 용)")
+    batch_parser.add_argument("--number", required=True, help="리포트 발행 호수 (예: 25)")
+    batch_parser.add_argument("--date", required=True, help="리포트 발행 날짜 (예: 2025년 12월 26일)")
+    batch_parser.add_argument("--num-news", type=int, default=4, help="선택할 뉴스 개수 (기본값: 4)")
+    batch_parser.add_argument("--quota", action="append", default=[], metavar="CATEGORY=N",
+                              help="카테고리별 최소 선택 개수 (반복 가능, 예: --quota 보험사=2)")
+
+    editions_parser = subparsers.add_parser("editions", help="한 번의 크롤링으로 팀별 에디션 여러 개 생성")
+    editions_parser.add_argument("--number", required=True, help="리포트 발행 호수 (예: 25)")
+    editions_parser.add_argument("--date", required=True, help="리포트 발행 날짜 (예: 2025년 12월 26일)")
+    editions_parser.add_argument("--config", type=Path, default=EDITIONS_FILE, help="에디션 설정 파일 (JSON)")
+    editions_parser.add_argument("--compare-sequential", action="store_true",
+                                 help="에디션을 하나씩 따로 실행한 시간도 측정 (크롤링 / Claude 호출이 에디션 수만큼 추가됨)")
+
+    bench_parser = subparsers.add_parser("bench-ppt", help="PPT 렌더링 벤치마크 (reports/sec, peak memory)")
+    bench_parser.add_argument("--n", type=int, default=20, help="렌더링 횟수")
+
+    telemetry_parser = subparsers.add_parser("telemetry", help="Claude 호출 텔레메트리 집계 (토큰, 지연, 비용)")
+    telemetry_parser.add_argument("run_ids", nargs="*", help="집계할 Run ID (기본값: 전체)")
+
+    history_parser = subparsers.add_parser("history", help="'이미 보도한 기사' 인덱스 관리")
+    history_parser.add_argument("--rebuild", action="store_true",
+                                help="과거 selected_news 결과(xlsx, output/runs/*/select.pkl)로 인덱스 재구축")
+    history_parser.add_argument("files", nargs="*", type=Path, help="재구축에 사용할 파일 (기본값: 자동 탐색)")
+
+    worker_parser = subparsers.add_parser("crawl-worker", help="공유 작업 큐의 크롤링 shard 처리 (다른 머신에서 실행)")
+    worker_parser.add_argument("--queue", type=Path, required=True, help="shard 작업 큐 파일 (--crawl-queue와 동일)")
+
+    startup_parser = subparsers.add_parser("startup", help="모듈별 import 시간 리포트 출력")
+    startup_parser.add_argument("--top", type=int, default=10, help="모듈별로 표시할 패키지 수")
+
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+
+    if args.command == "batch":
+        quotas = {}
+        for item in args.quota:
+            category, _, count = item.partition("=")
+            if not count.isdigit():
+                print(f"❌ 잘못된 할당량 형식입니다: {item} (예: 보험사=2)")
+                sys.exit(1)
+            quotas[category] = int(count)
+        if args.num_news <= 0:
+            print("❌ 뉴스 개수는 1개 이상이어야 합니다.")
+            sys.exit(1)
+        if sum(quotas.values()) > args.num_news:
+            print(f"❌ 할당량 합계({sum(quotas.values())}개)가 뉴스 개수({args.num_news}개)보다 많습니다.")
+            sys.exit(1)
+        main(resume=args.resume, prescreen=args.prescreen, profile=args.profile,
+             crawl_workers=args.crawl_workers, crawl_queue=args.crawl_queue, batch={
+            "number": args.number, "date": args.date, "num_news": args.num_news, "quotas": quotas
+        })
+    elif args.command == "ppt":
+        make_ppt_only(args.number, args.date, args.news_summary, args.ailab_summary)
+    elif args.command == "editions":
+        make_editions(args.number, args.date, args.config, args.compare_sequential)
+    elif args.command == "bench-ppt":
+        from src.ppt_maker import benchmark_reports
+        benchmark_reports(pptx_out=str(OUTPUT_DIR / "bench_output.pptx"), n=args.n)
+    elif args.command == "telemetry":
+        from src.telemetry import print_telemetry_report
+        print_telemetry_report(args.run_ids)
+    elif args.command == "history":
+        from src.history import rebuild_index, load_reported_keys
+        if args.rebuild:
+            rebuild_index(args.files or None)
+        else:
+            print(f"🗃️ 이미 보도한 기사: {len(load_reported_keys()['urls'])}개")
+    elif args.command == "crawl-worker":
+        from src.crawl_shards import run_worker
+        print(f"🧵 크롤링 shard {run_worker(args.queue)}개 처리 완료")
+    elif args.command == "startup":
+        from src.startup_report import print_startup_report
+        print_startup_report(top_n=args.top)
+    else:
+        main(resume=args.resume, prescreen=args.prescreen, profile=args.profile,
+             crawl_workers=args.crawl_workers, crawl_queue=args.crawl_queue)
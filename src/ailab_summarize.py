@@ -1,11 +1,14 @@
 from .openai_client import get_shared_client
-from .config import AILAB_CONTENT_FILE
+from .telemetry import create_message
+from .config import AILAB_CONTENT_FILE, AILAB_CHUNK_CACHE_DIR, get_ailab_files
+from .pipeline import is_cancelled
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional
+import hashlib
+import json
 import anthropic
 
-# Get shared Anthropic client instance
-client = get_shared_client()
-
 # ============================================================
 # Configuration Constants
 # ============================================================
@@ -14,6 +17,11 @@ MODEL_NAME = "claude-sonnet-4-6"
 MAX_TOKENS = 1024
 TEMPERATURE = 0.3
 
+# Map-reduce settings for long or multiple source documents
+CHUNK_CHARS = 6000 # max characters per chunk (documents shorter than this are sent as-is)
+CHUNK_MAX_TOKENS = 512 # max tokens for each chunk summary
+MAX_WORKERS = 4 # chunks summarized in parallel
+
 SYSTEM_PROMPT = (
     "You are a professional AI analyst specializing in Insurance and AI services. "
     "You write concise, structured, and business-oriented summaries in Korean."
@@ -45,41 +53,62 @@ USER_PROMPT_TEMPLATE = """
     {content}
     """
 
-# ============================================================
-# Functions
-# ============================================================
+CHUNK_PROMPT_TEMPLATE = """
+    <task>
+    The following text is one part of a longer AI Lab report.
+    Extract the key facts of this part as short Korean bullet points.
 
-# Return AI Lab news summarization results
-def ailab_summarized():
+    <requirements>
+    1. Write at most 5 bullet points, each starting with "- ".
+    2. Be concise and factual. Do NOT add information not mentioned in the text.
+    3. Keep names, numbers and dates exactly as written.
 
-    # Check if AI Lab content file exists
-    if not Path(AILAB_CONTENT_FILE).exists():
-        print(f"❌ 오류: AI Lab 콘텐츠 파일을 찾을 수 없습니다: {AILAB_CONTENT_FILE}")
-        print(f"   '{AILAB_CONTENT_FILE}' 파일을 생성하고 내용을 입력해주세요.")
-        return None
+    <source>
+    {source}
 
-    # Ailab Contents are saved in txt file
-    try:
-        with open(AILAB_CONTENT_FILE, "r", encoding="utf-8") as f:
-            content = f.read()
-    except Exception as e:
-        print(f"❌ AI Lab 콘텐츠 파일 읽기 실패: {e}")
-        return None
+    <text>
+    {content}
+    """
 
-    if not content or len(content.strip()) < 10:
-        print(f"❌ AI Lab 콘텐츠 파일이 비어있거나 내용이 너무 짧습니다.")
-        return None
+# ============================================================
+# Utility Functions
+# ============================================================
 
-    # Claude API call with error handling
+# Split text into chunks of at most chunk_chars, preferring paragraph / line boundaries
+def split_into_chunks(text: str, chunk_chars: int = CHUNK_CHARS) -> list:
+    chunks, current = [], ""
+    for line in text.splitlines(keepends=True):
+        # A single line longer than chunk_chars is hard-split
+        while len(line) > chunk_chars:
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(line[:chunk_chars])
+            line = line[chunk_chars:]
+        if len(current) + len(line) > chunk_chars:
+            chunks.append(current)
+            current = ""
+        current += line
+    if current.strip():
+        chunks.append(current)
+    return [c for c in chunks if c.strip()]
+
+
+# Claude API call with error handling (returns None on failure)
+def call_claude(prompt: str, max_tokens: int = MAX_TOKENS, caller: str = "ailab") -> Optional[str]:
     try:
-        response = client.messages.create(
+        # Client is built on first call (not at import) to keep startup fast
+        client = get_shared_client()
+        response = create_message(
+            client,
+            caller,
             model=MODEL_NAME,
-            max_tokens=MAX_TOKENS,
+            max_tokens=max_tokens,
             system=SYSTEM_PROMPT,
             messages=[
                 {
                     "role": "user",
-                    "content": USER_PROMPT_TEMPLATE.format(content=content)
+                    "content": prompt
                 }
             ]
         )
@@ -89,8 +118,7 @@ def ailab_summarized():
             print("❌ Claude API 응답이 비어있습니다.")
             return None
 
-        result = response.content[0].text.strip()
-        return result
+        return response.content[0].text.strip()
 
     except anthropic.RateLimitError as e:
         print(f"❌ Claude API 요청 한도 초과: {e}")
@@ -108,7 +136,91 @@ def ailab_summarized():
         return None
 
 
+# Summarize one chunk (map step). Results are cached by the hash of the full prompt
+# (source name + chunk), so editing one document does not re-summarize the others.
+def summarize_chunk(source: str, chunk: str) -> Optional[str]:
+    prompt = CHUNK_PROMPT_TEMPLATE.format(source=source, content=chunk)
+    key = hashlib.sha256(f"{MODEL_NAME}\n{prompt}".encode("utf-8")).hexdigest()
+    cache_file = Path(AILAB_CHUNK_CACHE_DIR) / f"{key}.json"
+
+    if cache_file.exists():
+        try:
+            return json.loads(cache_file.read_text(encoding="utf-8"))["summary"]
+        except Exception:
+            pass # broken cache entry -> summarize again
+
+    if is_cancelled():
+        return None # another stage failed: do not start new Claude calls
+
+    summary = call_claude(prompt, max_tokens=CHUNK_MAX_TOKENS, caller="ailab_chunk")
+    if summary is None:
+        return None
+
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"source": source, "summary": summary}, ensure_ascii=False),
+                              encoding="utf-8")
+    except Exception as e:
+        print(f"⚠️ 청크 요약 캐시 저장 실패: {e}")
+
+    return summary
+
+
+# ============================================================
+# Functions
+# ============================================================
+
+# Return AI Lab news summarization results
+# (short content -> single call, long or multiple documents -> chunked map-reduce)
+def ailab_summarized(files: list = None):
+    files = files or get_ailab_files()
+
+    # Check if AI Lab content file exists
+    if not files:
+        print(f"❌ 오류: AI Lab 콘텐츠 파일을 찾을 수 없습니다: {AILAB_CONTENT_FILE}")
+        print(f"   '{AILAB_CONTENT_FILE}' 파일을 생성하고 내용을 입력해주세요.")
+        return None
+
+    # Ailab Contents are saved in txt files
+    documents = []
+    for path in files:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+        except Exception as e:
+            print(f"❌ AI Lab 콘텐츠 파일 읽기 실패: {e}")
+            return None
+        if content.strip():
+            documents.append((Path(path).name, content))
+
+    total_length = sum(len(content.strip()) for _, content in documents)
+    if total_length < 10:
+        print(f"❌ AI Lab 콘텐츠 파일이 비어있거나 내용이 너무 짧습니다.")
+        return None
+
+    # Short single document: send as-is in one call
+    if len(documents) == 1 and len(documents[0][1]) <= CHUNK_CHARS:
+        return call_claude(USER_PROMPT_TEMPLATE.format(content=documents[0][1]))
+
+    # Map: summarize every chunk of every document in parallel
+    jobs = [(name, chunk) for name, content in documents for chunk in split_into_chunks(content)]
+    print(f"  📚 {len(documents)}개 문서, {len(jobs)}개 청크 요약 중...")
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        chunk_summaries = list(executor.map(lambda job: summarize_chunk(*job), jobs))
+
+    if any(summary is None for summary in chunk_summaries):
+        print("❌ 일부 청크 요약에 실패했습니다.")
+        return None
+
+    # Reduce: merge chunk notes into the [Title]/[Summary1]/[Summary2] format
+    notes = "\n\n".join(
+        f"[{name}]\n{summary}" for (name, _), summary in zip(jobs, chunk_summaries)
+    )
+    return call_claude(USER_PROMPT_TEMPLATE.format(content=notes))
+
+
 # Test (If needed)
 if __name__ == "__main__":
     result = ailab_summarized()
-    print(result)
\ No newline at end of file
+    print(result)
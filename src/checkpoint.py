@@ -0,0 +1,132 @@
+"""
+Run directory with per-stage checkpoints and a manifest, used to resume a run.
+
+output/runs/<run_id>/
+    manifest.json      # stage status, output file, input/output hashes
+    <stage>.pkl        # DataFrame outputs (pandas pickle)
+    <stage>.json       # other outputs (text, dict, list)
+"""
+import hashlib
+import itertools
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from .config import RUNS_DIR
+
+MANIFEST_NAME = "manifest.json"
+
+
+# sha256 of a file's bytes
+def file_hash(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+# sha256 of several strings (used to combine dependency hashes)
+def combine_hashes(*parts: str) -> str:
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class RunStore:
+    # New run. The directory is created exclusively, so runs started in the same second get their own
+    # id (20251230_090000, 20251230_090000_2, ...). Existing runs are only loaded through open().
+    def __init__(self, run_id: str = None, _existing: bool = False):
+        self._lock = threading.Lock()
+        if _existing:
+            self._set_run_id(run_id)
+            self.manifest = json.loads(self.manifest_file.read_text(encoding="utf-8"))
+            return
+
+        base = run_id or datetime.now().strftime("%Y%m%d_%H%M%S")
+        Path(RUNS_DIR).mkdir(parents=True, exist_ok=True)
+        for n in itertools.count(1):
+            self._set_run_id(base if n == 1 else f"{base}_{n}")
+            try:
+                self.run_dir.mkdir(exist_ok=False)
+                break
+            except FileExistsError:
+                continue
+        self.manifest = {"run_id": self.run_id, "created": datetime.now().isoformat(), "stages": {}}
+        self._write_manifest()
+
+    def _set_run_id(self, run_id: str):
+        self.run_id = run_id
+        self.run_dir = Path(RUNS_DIR) / run_id
+        self.manifest_file = self.run_dir / MANIFEST_NAME
+
+    # Open an existing run ("latest" = most recently created run)
+    @classmethod
+    def open(cls, run_id: str) -> "RunStore":
+        if run_id == "latest":
+            runs = sorted(p.parent.name for p in Path(RUNS_DIR).glob(f"*/{MANIFEST_NAME}"))
+            if not runs:
+                raise FileNotFoundError(f"재개할 실행 기록이 없습니다: {RUNS_DIR}")
+            run_id = runs[-1]
+
+        if not (Path(RUNS_DIR) / run_id / MANIFEST_NAME).exists():
+            raise FileNotFoundError(f"실행 기록을 찾을 수 없습니다: {Path(RUNS_DIR) / run_id}")
+        return cls(run_id, _existing=True)
+
+    # Run settings kept in the manifest, so --resume runs the same way (e.g. batch mode)
+    def set_option(self, key: str, value):
+        with self._lock:
+            self.manifest.setdefault("options", {})[key] = value
+            self._write_manifest()
+
+    def _write_manifest(self):
+        tmp = self.manifest_file.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+        tmp.replace(self.manifest_file)
+
+    # Input hash of a stage = its own fingerprint + output hashes of its dependencies
+    def input_hash(self, stage_name: str, deps: list, fingerprint: str = "") -> str:
+        stages = self.manifest["stages"]
+        return combine_hashes(stage_name, fingerprint, *(stages.get(d, {}).get("output_hash", "") for d in deps))
+
+    # True if the stage finished before with the same inputs
+    def is_complete(self, stage_name: str, input_hash: str) -> bool:
+        entry = self.manifest["stages"].get(stage_name)
+        return bool(
+            entry
+            and entry.get("status") == "done"
+            and entry.get("input_hash") == input_hash
+            and (self.run_dir / entry["file"]).exists()
+        )
+
+    def save(self, stage_name: str, value, input_hash: str):
+        if hasattr(value, "to_pickle"): # pandas DataFrame
+            path = self.run_dir / f"{stage_name}.pkl"
+            value.to_pickle(path)
+        else:
+            path = self.run_dir / f"{stage_name}.json"
+            path.write_text(json.dumps(value, ensure_ascii=False, indent=2, default=str), encoding="utf-8")
+
+        with self._lock:
+            self.manifest["stages"][stage_name] = {
+                "status": "done",
+                "file": path.name,
+                "input_hash": input_hash,
+                "output_hash": file_hash(path),
+                "finished": datetime.now().isoformat(),
+            }
+            self._write_manifest()
+
+    def load(self, stage_name: str):
+        path = self.run_dir / self.manifest["stages"][stage_name]["file"]
+        if path.suffix == ".pkl":
+            import pandas as pd
+            return pd.read_pickle(path)
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def mark_failed(self, stage_name: str, error: Exception):
+        with self._lock:
+            self.manifest["stages"][stage_name] = {
+                "status": "failed",
+                "error": str(error),
+                "finished": datetime.now().isoformat(),
+            }
+            self._write_manifest()
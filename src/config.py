@@ -2,7 +2,6 @@
 Configuration file for project paths and settings.
 """
 from pathlib import Path
-import sys
 
 # Project root directory (parent of src/)
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -11,22 +10,51 @@ PROJECT_ROOT = Path(__file__).parent.parent
 DATA_DIR = PROJECT_ROOT / "data"
 OUTPUT_DIR = PROJECT_ROOT / "output"
 TEMPLATES_DIR = PROJECT_ROOT / "templates"
+CACHE_DIR = OUTPUT_DIR / "cache"
+RUNS_DIR = OUTPUT_DIR / "runs"
+TELEMETRY_DIR = OUTPUT_DIR / "telemetry"
+HISTORY_DB = OUTPUT_DIR / "reported_news.sqlite3" # articles published in past issues
 
 # Specific file paths
 AILAB_CONTENT_FILE = DATA_DIR / "ailab_content.txt"
 SELECTED_NEWS_FILE = OUTPUT_DIR / "selected_news.xlsx"
 PPT_TEMPLATE_FILE = TEMPLATES_DIR / "AIWeeklyReport_format.pptx"
 
+# AI Lab source documents (every DATA_DIR file matching the pattern is summarized)
+AILAB_CONTENT_PATTERN = "ailab_*.txt"
+AILAB_CHUNK_CACHE_DIR = CACHE_DIR / "ailab_chunks"
+
+# Relevance pre-screen of crawled candidates (cached per article URL)
+PRESCREEN_CACHE_FILE = CACHE_DIR / "prescreen.json"
+
+# Company queries per industry for the news crawler
+SEARCH_CATEGORIES_FILE = DATA_DIR / "search_categories.json"
+
+# Multi-edition settings (one report per team from a single crawl)
+EDITIONS_FILE = DATA_DIR / "editions.json"
+
+
+
+# Return AI Lab source documents (AILAB_CONTENT_FILE first, then other matching files)
+def get_ailab_files() -> list:
+    files = sorted(DATA_DIR.glob(AILAB_CONTENT_PATTERN))
+    if AILAB_CONTENT_FILE in files:
+        files.remove(AILAB_CONTENT_FILE)
+    if AILAB_CONTENT_FILE.exists():
+        files.insert(0, AILAB_CONTENT_FILE)
+    return files
+
+
 # Ensure required directories exist
-OUTPUT_DIR.mkdir(exist_ok=True)
-
-# Validate critical directories exist
-if not DATA_DIR.exists():
-    print(f"❌ 오류: 필수 디렉토리가 없습니다: {DATA_DIR}")
-    print(f"   '{DATA_DIR}' 디렉토리를 생성해주세요.")
-    sys.exit(1)
-
-if not TEMPLATES_DIR.exists():
-    print(f"❌ 오류: 필수 디렉토리가 없습니다: {TEMPLATES_DIR}")
-    print(f"   '{TEMPLATES_DIR}' 디렉토리를 생성해주세요.")
-    sys.exit(1)
+# (called explicitly from main.py so that importing config has no side effects)
+def ensure_directories() -> bool:
+    OUTPUT_DIR.mkdir(exist_ok=True)
+
+    # Validate critical directories exist
+    for directory in (DATA_DIR, TEMPLATES_DIR):
+        if not directory.exists():
+            print(f"❌ 오류: 필수 디렉토리가 없습니다: {directory}")
+            print(f"   '{directory}' 디렉토리를 생성해주세요.")
+            return False
+
+    return True
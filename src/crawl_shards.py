@@ -0,0 +1,362 @@
+"""
+Sharded crawl over a SQLite-backed work queue.
+
+The company queries are listed in SEARCH_CATEGORIES order and split round-robin
+into shards. Workers claim one shard at a time and store the scored candidates
+of every query. A worker is either a local process started by crawl_sharded()
+or `python main.py crawl-worker --queue <db>` on another machine sharing the
+queue file. merge_results() then walks the queries in their original order and
+picks one article per query, exactly like the serial crawl. The DataFrame
+therefore does not depend on the number of workers or on which worker crawled
+which shard.
+
+Workers do not know which URLs earlier queries picked, so they collect a few
+extra candidates per query (OVERLAP_SLACK). The merge applies the
+candidates_per_query cap after removing the URLs already picked. If too few are
+left, it crawls that query again with the picked URLs excluded, the same way the
+serial crawl does.
+"""
+import json
+import multiprocessing
+import os
+import socket
+import sqlite3
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, wait
+from dataclasses import asdict
+from pathlib import Path
+from .config import CACHE_DIR
+from .pipeline import is_cancelled
+
+# ============================================================
+# Settings
+# ============================================================
+
+CRAWL_QUEUE_DB = CACHE_DIR / "crawl_queue.sqlite3" # default queue (local workers only)
+SHARDS_PER_WORKER = 4 # smaller shards balance slow queries across workers
+LEASE_SECONDS = 600 # a running shard without a heartbeat for this long is handed to another worker
+POLL_SECONDS = 2.0 # wait interval while remote workers finish their shards
+OVERLAP_SLACK = 3 # extra candidates per query for URLs that earlier queries may have picked
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS shards (
+    id       INTEGER PRIMARY KEY,
+    tasks    TEXT NOT NULL,
+    status   TEXT NOT NULL DEFAULT 'pending',
+    worker   TEXT,
+    claimed  REAL,
+    heartbeat REAL,
+    finished REAL,
+    result   TEXT
+);
+"""
+
+
+# ============================================================
+# Planning
+# ============================================================
+
+# [{"order": 0, "category": "보험사", "query": "삼성화재"}, ...] in crawl order
+def plan_tasks(categories: list) -> list:
+    tasks = []
+    for cat in categories:
+        for query in cat["queries"]:
+            tasks.append({"order": len(tasks), "category": cat["category"], "query": query})
+    return tasks
+
+
+# Round-robin split, so every shard gets a mix of categories
+def make_shards(tasks: list, num_shards: int) -> list:
+    num_shards = max(1, min(num_shards, len(tasks)))
+    return [tasks[i::num_shards] for i in range(num_shards)]
+
+
+# ============================================================
+# Queue
+# ============================================================
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def read_meta(conn: sqlite3.Connection) -> dict:
+    return dict(conn.execute("SELECT key, value FROM meta").fetchall())
+
+
+# Create a fresh queue (any previous queue in the same file is dropped).
+# Every queue gets a new generation id, so results of a previous queue are rejected.
+def create_queue(db_path: Path, cfg, categories: list, num_shards: int) -> int:
+    db_path = Path(db_path)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    shards = make_shards(plan_tasks(categories), num_shards)
+
+    conn = connect(db_path)
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM meta")
+        conn.execute("DELETE FROM shards")
+        if "heartbeat" not in {row[1] for row in conn.execute("PRAGMA table_info(shards)")}:
+            conn.execute("ALTER TABLE shards ADD COLUMN heartbeat REAL") # queue file from an older version
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", [
+            ("generation", uuid.uuid4().hex),
+            ("config", json.dumps(asdict(cfg), ensure_ascii=False)),
+        ])
+        conn.executemany(
+            "INSERT INTO shards (id, tasks) VALUES (?, ?)",
+            [(i, json.dumps(shard, ensure_ascii=False)) for i, shard in enumerate(shards)],
+        )
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return len(shards)
+
+
+# Atomically claim a pending shard (or one whose lease expired).
+# claimed identifies the claim; heartbeat is renewed after every query and decides the lease.
+# Returns {"id", "tasks", "claimed", "generation", "config"} or None when nothing is left.
+def claim_shard(conn: sqlite3.Connection, worker: str, lease: float = LEASE_SECONDS):
+    now = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        meta = read_meta(conn)
+        row = None
+        if "cancelled" not in meta:
+            row = conn.execute(
+                "SELECT id, tasks FROM shards WHERE status = 'pending' OR (status = 'running' AND heartbeat < ?) "
+                "ORDER BY id LIMIT 1",
+                (now - lease,),
+            ).fetchone()
+        if row:
+            conn.execute(
+                "UPDATE shards SET status = 'running', worker = ?, claimed = ?, heartbeat = ? WHERE id = ?",
+                (worker, now, now, row[0]),
+            )
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    if row is None:
+        return None
+    return {"id": row[0], "tasks": json.loads(row[1]), "claimed": now,
+            "generation": meta["generation"], "config": json.loads(meta["config"])}
+
+
+# Store the result only if this worker still holds the claim on the same queue generation
+# (the queue may have been re-created, or the lease expired and another worker took the shard)
+def complete_shard(conn: sqlite3.Connection, claim: dict, worker: str, result: dict) -> bool:
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        updated = 0
+        if read_meta(conn).get("generation") == claim["generation"]:
+            updated = conn.execute(
+                "UPDATE shards SET status = 'done', finished = ?, result = ? "
+                "WHERE id = ? AND worker = ? AND claimed = ? AND status = 'running'",
+                (time.time(), json.dumps(result, ensure_ascii=False), claim["id"], worker, claim["claimed"]),
+            ).rowcount
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    return updated == 1
+
+
+# Extend the lease of a running shard; False if this worker no longer holds the claim
+def renew_lease(conn: sqlite3.Connection, claim: dict, worker: str) -> bool:
+    return conn.execute(
+        "UPDATE shards SET heartbeat = ? WHERE id = ? AND worker = ? AND claimed = ? AND status = 'running'",
+        (time.time(), claim["id"], worker, claim["claimed"]),
+    ).rowcount == 1
+
+
+# Ask every worker to stop after its current query (used when the pipeline fails)
+def cancel_queue(db_path: Path):
+    conn = connect(db_path)
+    try:
+        conn.execute("INSERT OR REPLACE INTO meta VALUES ('cancelled', '1')")
+    finally:
+        conn.close()
+
+
+def queue_status(db_path: Path) -> dict:
+    conn = connect(db_path)
+    try:
+        rows = conn.execute("SELECT status, COUNT(*) FROM shards GROUP BY status").fetchall()
+        cancelled = "cancelled" in read_meta(conn)
+    finally:
+        conn.close()
+    return {"pending": 0, "running": 0, "done": 0, **dict(rows), "cancelled": cancelled}
+
+
+# ============================================================
+# Worker
+# ============================================================
+
+# Crawl shards until the queue is empty; returns the number of shards this worker finished
+def run_worker(db_path: Path, worker: str = None, lease: float = LEASE_SECONDS) -> int:
+    from .news_crawler import CrawlerConfig, setup_ssl, make_article_config, collect_candidates
+    from .history import load_reported_keys
+
+    db_path = Path(db_path)
+    if not db_path.exists():
+        print(f"❌ 크롤링 작업 큐를 찾을 수 없습니다: {db_path}")
+        return 0
+
+    worker = worker or f"{socket.gethostname()}-{os.getpid()}"
+    conn = connect(db_path)
+    setup_ssl()
+    generation, cfg, article_config, reported = None, None, None, None
+    try:
+        finished = 0
+        while True:
+            claim = claim_shard(conn, worker, lease)
+            if claim is None:
+                return finished
+
+            # The config is read per claim: the queue may have been re-created with other settings
+            if claim["generation"] != generation:
+                generation = claim["generation"]
+                cfg = CrawlerConfig(**claim["config"])
+                article_config = make_article_config(cfg)
+                reported = load_reported_keys() if cfg.skip_reported else None
+
+            start = time.perf_counter()
+            limit = cfg.candidates_per_query + OVERLAP_SLACK
+            result, lost = {}, False
+            for task in claim["tasks"]:
+                if "cancelled" in read_meta(conn):
+                    return finished
+                candidates, skipped = collect_candidates(task["category"], task["query"], cfg, article_config,
+                                                         reported, verbose=False, limit=limit)
+                result[str(task["order"])] = {"candidates": candidates, "skipped": skipped, "limit": limit}
+                # A slow shard keeps its lease as long as its queries keep finishing
+                if not renew_lease(conn, claim, worker):
+                    lost = True
+                    break
+
+            if lost or not complete_shard(conn, claim, worker, result):
+                print(f"  ⚠️ shard {claim['id']}: 다른 작업자나 새 큐로 넘어가 결과를 버립니다 ({worker})")
+                continue
+            finished += 1
+
+            found = sum(len(r["candidates"]) for r in result.values())
+            print(f"  ✅ shard {claim['id']}: 쿼리 {len(claim['tasks'])}개, 후보 {found}개 "
+                  f"({time.perf_counter() - start:.1f}초, {worker})")
+    finally:
+        conn.close()
+
+
+# ============================================================
+# Merge
+# ============================================================
+
+# Replay the queries in crawl order and pick one article per query (same rules as crawl_news)
+def merge_results(db_path: Path):
+    import pandas as pd
+    from .news_crawler import CrawlerConfig, pick_best, setup_ssl, make_article_config, collect_candidates
+    from .history import load_reported_keys
+
+    conn = connect(db_path)
+    try:
+        meta = read_meta(conn)
+        rows = conn.execute("SELECT id, tasks, status, result FROM shards").fetchall()
+    finally:
+        conn.close()
+
+    unfinished = [shard_id for shard_id, _, status, _ in rows if status != "done"]
+    if unfinished:
+        raise RuntimeError(f"완료되지 않은 shard가 있습니다: {unfinished}")
+
+    cfg = CrawlerConfig(**json.loads(meta["config"]))
+    tasks, outputs = [], {}
+    for _, shard_tasks, _, result in rows:
+        tasks.extend(json.loads(shard_tasks))
+        outputs.update(json.loads(result))
+    tasks.sort(key=lambda task: task["order"])
+
+    results, seen_urls, category_count = [], set(), {}
+    skipped_reported = sum(output["skipped"] for output in outputs.values())
+    recrawl = None # (article_config, reported), built on the first re-crawl
+    recrawled = 0
+    for task in tasks:
+        if len(results) >= cfg.max_total:
+            break
+        output = outputs[str(task["order"])]
+
+        # The serial crawl fills candidates_per_query with URLs no earlier query picked
+        candidates = [c for c in output["candidates"] if c["link"] not in seen_urls]
+        feed_exhausted = len(output["candidates"]) < output["limit"]
+        if len(candidates) < cfg.candidates_per_query and not feed_exhausted:
+            if recrawl is None:
+                setup_ssl()
+                recrawl = (make_article_config(cfg), load_reported_keys() if cfg.skip_reported else None)
+            candidates, _ = collect_candidates(task["category"], task["query"], cfg, recrawl[0], recrawl[1],
+                                               seen_urls, verbose=False)
+            recrawled += 1
+
+        best = pick_best(candidates[:cfg.candidates_per_query], seen_urls)
+        if best:
+            seen_urls.add(best["link"])
+            results.append(best)
+            category_count[task["category"]] = category_count.get(task["category"], 0) + 1
+
+    for category, count in category_count.items():
+        print(f"  📊 {category}: {count}개")
+    if recrawled:
+        print(f"  🔁 앞선 쿼리와 기사가 겹쳐 다시 수집한 쿼리 {recrawled}개")
+    if skipped_reported:
+        print(f"\n  ⏭️ 이미 보도한 기사 {skipped_reported}개 제외")
+
+    return pd.DataFrame(results)
+
+
+# ============================================================
+# Sharded Crawl
+# ============================================================
+
+# crawl_news() with cfg.workers > 1. Other machines can join with
+# `python main.py crawl-worker --queue <queue_db>` while this waits for the shards.
+def crawl_sharded(cfg, categories: list = None, queue_db: Path = None, num_shards: int = None):
+    import pandas as pd
+    from .news_crawler import SEARCH_CATEGORIES
+
+    categories = categories or SEARCH_CATEGORIES
+    queue_db = Path(queue_db or cfg.queue_db or CRAWL_QUEUE_DB)
+    num_shards = num_shards or cfg.workers * SHARDS_PER_WORKER
+    num_shards = create_queue(queue_db, cfg, categories, num_shards)
+
+    total_queries = sum(len(cat["queries"]) for cat in categories)
+    print(f"📅 최근 {cfg.days}일 이내 뉴스 수집")
+    print(f"📌 쿼리 {total_queries}개 → shard {num_shards}개, 로컬 프로세스 {cfg.workers}개")
+    print(f"   다른 머신에서 참여: python main.py crawl-worker --queue {queue_db}\n")
+
+    start = time.perf_counter()
+    # spawn: crawl_news() runs inside the pipeline's stage threads, where fork is unsafe
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=cfg.workers, mp_context=context) as executor:
+        host = socket.gethostname()
+        futures = [executor.submit(run_worker, str(queue_db), f"{host}-{os.getpid()}-{i + 1}")
+                   for i in range(cfg.workers)]
+        while wait(futures, timeout=POLL_SECONDS).not_done:
+            if is_cancelled():
+                cancel_queue(queue_db) # workers stop after their current query
+                return pd.DataFrame()
+        for future in futures:
+            future.result()
+
+    # Shards still held by remote workers: wait, and take them over once their lease expires
+    while queue_status(queue_db)["done"] < num_shards:
+        if is_cancelled():
+            cancel_queue(queue_db)
+            return pd.DataFrame()
+        time.sleep(POLL_SECONDS)
+        run_worker(queue_db, f"{socket.gethostname()}-{os.getpid()}-main")
+
+    print(f"\n  ⏱️ 크롤링 {time.perf_counter() - start:.1f}초 (shard {num_shards}개)")
+    return merge_results(queue_db)
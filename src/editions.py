@@ -0,0 +1,211 @@
+"""
+Multi-edition reports from a single crawl.
+
+Each edition (team) picks its own SEARCH_CATEGORIES subset, template and
+insight framing. The union of categories is crawled once, every
+(article, insight framing) pair is summarized once and shared, and the
+editions are rendered in a process pool.
+"""
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from .config import PROJECT_ROOT, OUTPUT_DIR, PPT_TEMPLATE_FILE
+
+# ============================================================
+# Settings
+# ============================================================
+
+SUMMARY_WORKERS = 4 # parallel Claude calls for the shared summaries
+RENDER_WORKERS = 4 # processes rendering editions
+
+
+@dataclass
+class Edition:
+    name: str
+    categories: list = field(default_factory=list) # SEARCH_CATEGORIES names (empty = all)
+    template: str = str(PPT_TEMPLATE_FILE)
+    insight_focus: str = "" # framing of [Insight] for this team
+    num_news: int = 4
+    quotas: dict = field(default_factory=dict)
+
+
+# Load editions from a JSON file: [{"name": ..., "categories": [...], "template": ..., ...}, ...]
+def load_editions(path: Path) -> list:
+    with open(path, "r", encoding="utf-8") as f:
+        raw = json.load(f)
+
+    editions = []
+    for item in raw:
+        edition = Edition(**item)
+        template = Path(edition.template)
+        edition.template = str(template if template.is_absolute() else PROJECT_ROOT / template)
+        editions.append(edition)
+
+    names = [e.name for e in editions]
+    if len(set(names)) != len(names):
+        raise ValueError(f"에디션 이름이 중복되었습니다: {names}")
+    return editions
+
+
+# Render one edition (runs in a worker process) and return its render time
+def _render_edition(template: str, pptx_out: str, number: str, date: str, text1: str, text2: str) -> float:
+    from .ppt_maker import create_report
+    start = time.perf_counter()
+    create_report(template, pptx_out, number, date, text1, text2)
+    return time.perf_counter() - start
+
+
+# ============================================================
+# Main Function
+# ============================================================
+
+# Run each edition on its own, the way it would run without sharing (own crawl, AI Lab summary,
+# summaries and render), and return the measured wall time. Outputs go to a temporary directory.
+def measure_sequential(editions: list, number: str, date: str) -> float:
+    import tempfile
+    from .news_crawler import SEARCH_CATEGORIES, CrawlerConfig, crawl_news, auto_select_articles
+    from .news_summarize import summarize_article, auto_choose_summaries
+    from .ailab_summarize import ailab_summarized
+
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as tmp:
+        for edition in editions:
+            print(f"\n🐢 [{edition.name}] 단독 실행 (비교 측정)")
+            categories = [c for c in SEARCH_CATEGORIES
+                          if not edition.categories or c["category"] in edition.categories]
+            df = crawl_news(CrawlerConfig(), categories=categories)
+            ailab_text = ailab_summarized()
+            if df.empty or not ailab_text:
+                print(f"  ⚠️ [{edition.name}] 크롤링 또는 AI Lab 요약 실패")
+                continue
+            selected = auto_select_articles(df, num_select=edition.num_news, quotas=edition.quotas, save=False)
+
+            with ThreadPoolExecutor(max_workers=SUMMARY_WORKERS) as executor:
+                summaries = list(executor.map(
+                    lambda row: summarize_article(row["title"], row["content"], edition.insight_focus or None),
+                    [row for _, row in selected.iterrows()],
+                ))
+            items = [
+                {"index": i + 1, "title": row["title"], "summary": summary}
+                for i, ((_, row), summary) in enumerate(zip(selected.iterrows(), summaries))
+                if summary
+            ]
+            text1 = auto_choose_summaries(items)
+            if text1:
+                _render_edition(edition.template, str(Path(tmp) / f"{edition.name}.pptx"),
+                                number, date, text1, ailab_text)
+    return time.perf_counter() - start
+
+
+# Crawl and summarize once for all editions, then render every edition in parallel
+# compare_sequential: afterwards run every edition on its own and report the measured time
+# (crawls and calls Claude again for every edition)
+def run_editions(editions: list, number: str, date: str, compare_sequential: bool = False) -> dict:
+    from .news_crawler import SEARCH_CATEGORIES, crawl_news, auto_select_articles
+    from .news_summarize import summarize_article, auto_choose_summaries
+    from .ailab_summarize import ailab_summarized
+    from .history import add_reported, published_rows
+    import pandas as pd
+
+    wall_start = time.perf_counter()
+
+    # 1단계: 모든 에디션 카테고리의 합집합을 한 번만 크롤링
+    wanted = set()
+    for edition in editions:
+        wanted.update(edition.categories or [c["category"] for c in SEARCH_CATEGORIES])
+    categories = [c for c in SEARCH_CATEGORIES if c["category"] in wanted]
+
+    print(f"📰 공통 크롤링: {len(categories)}개 카테고리 ({len(editions)}개 에디션)")
+    start = time.perf_counter()
+    df = crawl_news(categories=categories)
+    crawl_time = time.perf_counter() - start
+    if df.empty:
+        raise ValueError("수집된 기사가 없습니다.")
+
+    # 2단계: AI Lab 요약 (모든 에디션 공통)
+    start = time.perf_counter()
+    ailab_text = ailab_summarized()
+    ailab_time = time.perf_counter() - start
+    if not ailab_text:
+        raise ValueError("AI Lab 요약 생성에 실패했습니다.")
+
+    # 3단계: 에디션별 기사 선택 (공통 크롤링 결과에서)
+    selections = {}
+    for edition in editions:
+        subset = df[df["category"].isin(edition.categories)] if edition.categories else df
+        print(f"\n📌 [{edition.name}] 기사 선택")
+        selections[edition.name] = auto_select_articles(
+            subset.reset_index(drop=True), num_select=edition.num_news, quotas=edition.quotas, save=False
+        )
+
+    # 4단계: (기사, 인사이트 관점) 조합별로 한 번만 요약
+    jobs = {}
+    for edition in editions:
+        for _, row in selections[edition.name].iterrows():
+            jobs.setdefault((row["link"], edition.insight_focus), (row["title"], row["content"]))
+
+    print(f"\n🤖 공통 요약: {len(jobs)}건 (에디션별 합계 "
+          f"{sum(len(s) for s in selections.values())}건)")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=SUMMARY_WORKERS) as executor:
+        futures = {
+            key: executor.submit(summarize_article, title, content, key[1] or None)
+            for key, (title, content) in jobs.items()
+        }
+        summaries = {key: future.result() for key, future in futures.items()}
+    summary_time = time.perf_counter() - start
+
+    # 5단계: 에디션별 요약 자동 채택 후 프로세스 풀에서 PPT 렌더링
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    render_jobs, published = {}, {}
+    for edition in editions:
+        items = [
+            {"index": i + 1, "title": row["title"], "summary": summaries[(row["link"], edition.insight_focus)]}
+            for i, (_, row) in enumerate(selections[edition.name].iterrows())
+            if summaries[(row["link"], edition.insight_focus)]
+        ]
+        print(f"\n📌 [{edition.name}] 요약 선택")
+        text1 = auto_choose_summaries(items)
+        if not text1:
+            print(f"  ⚠️ [{edition.name}] 사용할 요약이 없어 건너뜁니다.")
+            continue
+        pptx_out = OUTPUT_DIR / f"AIWeeklyReport_{edition.name}_{timestamp}.pptx"
+        render_jobs[edition.name] = (edition.template, str(pptx_out), number, date, text1, ailab_text)
+        published[edition.name] = published_rows(selections[edition.name], items, text1)
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=min(RENDER_WORKERS, max(len(render_jobs), 1))) as executor:
+        futures = {name: executor.submit(_render_edition, *args) for name, args in render_jobs.items()}
+        render_times = {name: future.result() for name, future in futures.items()}
+    render_wall = time.perf_counter() - start
+
+    wall_time = time.perf_counter() - wall_start
+
+    # The single-edition comparison crawls first, so it must not skip the articles published just now
+    sequential = measure_sequential(editions, number, date) if compare_sequential else None
+
+    # 6단계: 에디션에 실린 기사를 저장하고 '이미 보도한 기사' 인덱스에 추가 (다음 호 크롤링에서 제외)
+    # selected_news_<edition>_<timestamp>.xlsx holds only the published rows; history --rebuild reads it
+    for name, rows in published.items():
+        rows.to_excel(OUTPUT_DIR / f"selected_news_{name}_{timestamp}.xlsx", index=False, engine="openpyxl")
+    if published:
+        count = add_reported(pd.concat(published.values()).drop_duplicates("link"), issue=number)
+        print(f"  🗃️ 이미 보도한 기사 인덱스에 {count}개 추가")
+
+    print("\n" + "="*60)
+    print("⏱️ 멀티 에디션 소요 시간")
+    print("="*60)
+    print(f"  크롤링 {crawl_time:.1f}s | AI Lab {ailab_time:.1f}s | 요약 {summary_time:.1f}s | "
+          f"렌더링 {render_wall:.1f}s (순차 합계 {sum(render_times.values()):.1f}s)")
+    print(f"  ⌛ 전체 소요 시간: {wall_time:.1f}s")
+    if sequential is not None:
+        print(f"  🐢 에디션별로 따로 실행 시 (측정): {sequential:.1f}s ({sequential / wall_time:.1f}배)")
+    else:
+        print("  🐢 에디션별 단독 실행과 비교하려면 --compare-sequential 옵션을 사용하세요.")
+    for name, (_, pptx_out, *_) in render_jobs.items():
+        print(f"  📁 [{name}] {pptx_out}")
+
+    return {name: args[1] for name, args in render_jobs.items()}
@@ -0,0 +1,167 @@
+"""
+SQLite index of articles already published in past issues.
+
+crawl_news() checks the URL and normalized title of every RSS entry against
+this index before downloading the article body (and the content fingerprint
+right after), so stories covered last week are not crawled, scored or
+summarized again.
+"""
+import hashlib
+import json
+import re
+import sqlite3
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from .config import HISTORY_DB, OUTPUT_DIR, RUNS_DIR, SELECTED_NEWS_FILE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reported (
+    url         TEXT PRIMARY KEY,
+    norm_title  TEXT NOT NULL,
+    fingerprint TEXT,
+    title       TEXT,
+    company     TEXT,
+    issue       TEXT,
+    added       TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_reported_title ON reported (norm_title);
+CREATE INDEX IF NOT EXISTS idx_reported_fingerprint ON reported (fingerprint);
+"""
+
+NON_WORD_RE = re.compile(r"[^0-9a-z가-힣]+")
+FINGERPRINT_CHARS = 500 # leading characters of the body used for the fingerprint
+
+
+# ============================================================
+# Keys
+# ============================================================
+
+# "삼성화재, AI 챗봇 출시 - 한국경제" -> "삼성화재ai챗봇출시"
+def normalize_title(title: str) -> str:
+    if " - " in title:
+        title = title.rsplit(" - ", 1)[0]
+    return NON_WORD_RE.sub("", title.lower())
+
+
+# Hash of the whitespace-free leading part of the body (same story under another URL)
+def content_fingerprint(content: str) -> str:
+    if not content:
+        return ""
+    text = "".join(content.split())[:FINGERPRINT_CHARS]
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+# ============================================================
+# Index
+# ============================================================
+
+def connect(db_path: Path = None) -> sqlite3.Connection:
+    db_path = Path(db_path or HISTORY_DB)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(SCHEMA)
+    return conn
+
+
+# All keys as in-memory sets for O(1) checks inside the crawl loop
+def load_reported_keys(db_path: Path = None) -> dict:
+    if not Path(db_path or HISTORY_DB).exists():
+        return {"urls": set(), "titles": set(), "fingerprints": set()}
+
+    with closing(connect(db_path)) as conn:
+        rows = conn.execute("SELECT url, norm_title, fingerprint FROM reported").fetchall()
+    return {
+        "urls": {r[0] for r in rows},
+        "titles": {r[1] for r in rows if r[1]},
+        "fingerprints": {r[2] for r in rows if r[2]},
+    }
+
+
+# Add published articles (DataFrame with link/title/content/company columns)
+def add_reported(df, issue: str = "", db_path: Path = None) -> int:
+    now = datetime.now().isoformat()
+    rows = [
+        (
+            row["link"],
+            normalize_title(str(row.get("title", ""))),
+            content_fingerprint(str(row.get("content", "") or "")),
+            row.get("title", ""),
+            row.get("company", ""),
+            str(issue),
+            now,
+        )
+        for _, row in df.iterrows()
+        if row.get("link")
+    ]
+    with closing(connect(db_path)) as conn, conn: # closing() closes, `conn` commits the transaction
+        conn.executemany("INSERT OR REPLACE INTO reported VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+    return len(rows)
+
+
+# Rows of the selection whose summary made it into the report text
+# (summaries: [{"index": 1-based row, "summary": ...}], chosen_text: joined summaries in the report)
+def published_rows(selected_df, summaries: list, chosen_text: str):
+    published = [item["index"] - 1 for item in summaries if item["summary"] and item["summary"] in chosen_text]
+    return selected_df.iloc[published]
+
+
+# Articles published by a pipeline run (output/runs/<run_id>); None unless the PPT was created
+def load_run_published(run_dir: Path):
+    import pandas as pd
+
+    run_dir = Path(run_dir)
+    manifest_file = run_dir / "manifest.json"
+    if not manifest_file.exists():
+        return None
+    stages = json.loads(manifest_file.read_text(encoding="utf-8"))["stages"]
+    if any(stages.get(name, {}).get("status") != "done" for name in ("select", "summarize", "choose", "ppt")):
+        return None
+
+    def load_json(name):
+        return json.loads((run_dir / stages[name]["file"]).read_text(encoding="utf-8"))
+
+    return published_rows(pd.read_pickle(run_dir / stages["select"]["file"]), load_json("summarize"),
+                          load_json("choose"))
+
+
+# Past selections: output/selected_news_*.xlsx (e.g. the published rows of every edition) and the
+# select.pkl of runs that created a PPT. The scratch SELECTED_NEWS_FILE is written at selection time,
+# before any summary or PPT exists, so it is only used when passed explicitly.
+def find_past_selections() -> list:
+    scratch = Path(SELECTED_NEWS_FILE).resolve()
+    files = sorted(path for path in Path(OUTPUT_DIR).glob("**/selected_news*.xlsx") if path.resolve() != scratch)
+    files += [
+        path for path in sorted(Path(RUNS_DIR).glob("*/select.pkl"))
+        if load_run_published(path.parent) is not None
+    ]
+    return [f for f in files if f.exists()]
+
+
+# Drop the index and rebuild it from past selected_news outputs
+# (runs/<run_id>/select.pkl: only the articles whose summary was chosen for the report)
+def rebuild_index(files: list = None, db_path: Path = None) -> int:
+    import pandas as pd
+
+    files = files or find_past_selections()
+    with closing(connect(db_path)) as conn, conn:
+        conn.execute("DELETE FROM reported")
+
+    total = 0
+    for path in files:
+        path = Path(path)
+        if path.suffix == ".pkl":
+            df = load_run_published(path.parent)
+            if df is None:
+                print(f"  ⏭️ {path}: PPT까지 완료되지 않은 실행이라 제외")
+                continue
+            issue = path.parent.name
+        else:
+            df = pd.read_excel(path, engine="openpyxl")
+            issue = path.stem
+        added = add_reported(df, issue=issue, db_path=db_path)
+        print(f"  📥 {path}: {added}개")
+        total += added
+
+    print(f"✅ 이미 보도한 기사 인덱스 재구축 완료: {total}개 ({db_path or HISTORY_DB})")
+    return total
@@ -1,7 +1,9 @@
+import json
 import ssl
 import urllib3
 import logging
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 
 import feedparser
@@ -9,7 +11,9 @@ import pandas as pd
 import requests
 from googlenewsdecoder import gnewsdecoder
 from newspaper import Article, Config
-from .config import SELECTED_NEWS_FILE
+from .config import SELECTED_NEWS_FILE, SEARCH_CATEGORIES_FILE
+from .history import load_reported_keys, normalize_title, content_fingerprint
+from .pipeline import is_cancelled
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,38 +34,14 @@ PRIORITY_KEYWORDS = {
     "플랫폼": 3, "솔루션": 3, "시스템": 2,
 }
 
-# To identify financial companies of a certain scale, the following companies were listed
-# category: Industry of the company
-# queries: List of company names to search for
-SEARCH_CATEGORIES = [
-    {
-        "category": "보험사",
-        "queries": [
-            "삼성화재", "현대해상", "DB손해보험", "KB손해보험", "메리츠화재", "토스인슈어런스",
-            "삼성생명", "교보생명", "한화생명", "신한라이프", "NH농협생명", "KB라이프", "NH농협생명"
-        ]
-    },
-    {
-        "category": "은행",
-        "queries": ["토스뱅크", "우리은행", "국민은행", "신한은행", "하나은행", "기업은행"]
-    },
-    {
-        "category": "카드사",
-        "queries": ["삼성카드", "신한카드", "KB국민카드", "현대카드", "롯데카드", "우리카드", "하나카드", "BC카드", "NH농협카드"]
-    },
-    {
-        "category": "Tech",
-        "queries": ["구글", "OpenAI", "마이크로소프트"]
-    },
-    {
-        "category": "증권사",
-        "queries": ["NH투자증권", "미래에셋증권", "한국투자증권", "삼성증권", "신한투자증권", "KB증권", "키움증권", "토스증권"]
-    },
-    {
-        "category": "기타",
-        "queries": ["금융", "인공지능", "기후", "자율주행", "보험"]
-    },
-]
+# To identify financial companies of a certain scale, the companies are listed in
+# data/search_categories.json: [{"category": industry, "queries": [company names]}, ...]
+def load_search_categories(path: Path = SEARCH_CATEGORIES_FILE) -> list:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+SEARCH_CATEGORIES = load_search_categories()
 
 # Calculate total number of companies from SEARCH_CATEGORIES
 TOTAL_COMPANIES = sum(len(cat["queries"]) for cat in SEARCH_CATEGORIES)
@@ -75,6 +55,9 @@ class CrawlerConfig:
     min_content_length: int = 150 # minimum length of article content
     request_timeout: int = 15 # seconds
     user_agent: str = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+    skip_reported: bool = True # skip articles already published in past issues (history index)
+    workers: int = 1 # crawl processes; > 1 splits the queries into shards (src/crawl_shards.py)
+    queue_db: str = "" # shard work queue shared with other machines ("" = output/cache/crawl_queue.sqlite3)
 
 # ============================================================
 # SSL Settings
@@ -142,7 +125,9 @@ def select_articles(df: pd.DataFrame, num_select: int = 4) -> pd.DataFrame:
     print(f"📰 총 {len(df)}개 기사 수집 완료 - {num_select}개를 선택하세요")
     print(f"{'='*60}\n")
     
-    display_df = df[["category", "company", "score", "title"]].copy()
+    # AI pre-screen columns (src/prescreen.py) are shown next to the keyword score when present
+    columns = ["category", "company", "score", "ai_score", "ai_reason", "title"]
+    display_df = df[[c for c in columns if c in df.columns]].copy()
     display_df.index = range(1, len(df) + 1)
     print(display_df.to_string())
 
@@ -200,22 +185,145 @@ def select_articles(df: pd.DataFrame, num_select: int = 4) -> pd.DataFrame:
     return selected_df
 
 
+# ============================================================
+# Select Articles (Headless / batch mode)
+# ============================================================
+
+# Pick the top articles by score without user input.
+# quotas: {category: count} reserved first, then the rest is filled by overall score.
+# save: also write SELECTED_NEWS_FILE (off for callers that keep their own selection, e.g. editions)
+def auto_select_articles(df: pd.DataFrame, num_select: int = 4, quotas: dict = None,
+                         save: bool = True) -> pd.DataFrame:
+    if df.empty:
+        print("선택할 기사가 없습니다.")
+        return df
+
+    ranked = df.sort_values("score", ascending=False, kind="stable")
+    picked = []
+
+    for category, count in (quotas or {}).items():
+        # Quotas never push the selection past num_select (later categories are capped)
+        allowed = min(count, num_select - len(picked))
+        if allowed < count:
+            print(f"⚠️ [{category}] 할당량 {count}개 중 {allowed}개만 적용합니다 (선택 개수 {num_select}개 초과).")
+        top = ranked[ranked["category"] == category].head(allowed)
+        if len(top) < allowed:
+            print(f"⚠️ [{category}] 기사가 {len(top)}개뿐이라 할당량 {allowed}개를 채우지 못했습니다.")
+        picked.extend(top.index)
+
+    for idx in ranked.index:
+        if len(picked) >= num_select:
+            break
+        if idx not in picked:
+            picked.append(idx)
+
+    selected_df = ranked.loc[ranked.index.isin(picked)].reset_index(drop=True)
+
+    print(f"\n✅ 점수 기준 자동 선택 완료 ({len(selected_df)}개)")
+    print(selected_df[["category", "company", "score", "title"]].to_string())
+    if not save:
+        return selected_df
+
+    try:
+        selected_df.to_excel(
+            SELECTED_NEWS_FILE,
+            index=False,
+            engine='openpyxl'
+        )
+        print(f"📁 Excel 저장 완료: {SELECTED_NEWS_FILE}")
+    except Exception as e:
+        print(f"❌ Excel 파일 저장 실패: {e}")
+
+    return selected_df
+
+
 # ============================================================
 # Main Crawler
 # ============================================================
-def crawl_news(cfg: CrawlerConfig = CrawlerConfig()) -> pd.DataFrame:
-    setup_ssl()
-    
+def make_article_config(cfg: CrawlerConfig) -> Config:
     article_config = Config()
     article_config.browser_user_agent = cfg.user_agent
     article_config.request_timeout = cfg.request_timeout
+    return article_config
+
+
+# Scored candidates (at most limit, default cfg.candidates_per_query) for one company query.
+# Returns (candidates, number of entries skipped as already reported).
+def collect_candidates(category: str, company: str, cfg: CrawlerConfig, article_config: Config,
+                       reported: dict = None, seen_urls: set = frozenset(), verbose: bool = True,
+                       limit: int = None) -> tuple:
+    feed = feedparser.parse(get_rss_url(company, cfg.days))
+    limit = limit or cfg.candidates_per_query
+
+    candidates, skipped_reported = [], 0
+    for entry in feed.entries:
+        if len(candidates) >= limit:
+            break
+        # Articles are excluded if the title contains any EXCLUDE KEYWORDS
+        if any(kw in entry.title for kw in EXCLUDE_KEYWORDS):
+            continue
+
+        # Articles already published in past issues are skipped before decoding / downloading
+        if reported and normalize_title(entry.title) in reported["titles"]:
+            skipped_reported += 1
+            continue
+
+        # Decode URL (RSS URL -> Original URL)
+        url = decode_url(entry.link)
+        if url in seen_urls:
+            continue
+        if reported and url in reported["urls"]:
+            skipped_reported += 1
+            continue
+
+        # Fetch Article Content
+        content = fetch_article(url, article_config)
+        if not content:
+            continue
+        if reported and content_fingerprint(content) in reported["fingerprints"]:
+            skipped_reported += 1
+            continue
+
+        #Calculate Score of Article
+        score = calculate_score(entry.title, content)
+        candidates.append({
+            "category": category,
+            "company": company,
+            "title": entry.title,
+            "published": entry.published,
+            "link": url,
+            "content": content,
+            "score": score
+        })
+        if verbose:
+            print(f"    📰 {entry.title[:35]}... (점수: {score})")
+
+    return candidates, skipped_reported
+
+
+# Highest scored candidate whose URL was not picked for an earlier query
+def pick_best(candidates: list, seen_urls: set) -> Optional[dict]:
+    remaining = [c for c in candidates if c["link"] not in seen_urls]
+    return max(remaining, key=lambda x: x["score"]) if remaining else None
+
+
+# categories: subset of SEARCH_CATEGORIES to crawl (None = all)
+def crawl_news(cfg: CrawlerConfig = CrawlerConfig(), categories: list = None) -> pd.DataFrame:
+    if cfg.workers > 1:
+        from .crawl_shards import crawl_sharded
+        return crawl_sharded(cfg, categories)
+
+    setup_ssl()
+    article_config = make_article_config(cfg)
 
     results, seen_urls = [], set()
+    reported = load_reported_keys() if cfg.skip_reported else None
+    skipped_reported = 0
     
     print(f"📅 최근 {cfg.days}일 이내 뉴스 수집")
     print(f"📌 기업당 1개, 총 {cfg.max_total}개 목표\n")
     
-    for cat in SEARCH_CATEGORIES:
+    for cat in categories or SEARCH_CATEGORIES:
         if len(results) >= cfg.max_total:
             break
             
@@ -223,47 +331,17 @@ def crawl_news(cfg: CrawlerConfig = CrawlerConfig()) -> pd.DataFrame:
         category_count = 0
         
         for company in cat["queries"]:
-            if len(results) >= cfg.max_total:
+            if len(results) >= cfg.max_total or is_cancelled():
                 break
             
             print(f"\n  🔍 {company}")
-            # Article List Extraction
-            feed = feedparser.parse(get_rss_url(company, cfg.days))
-            
-            candidates = []
-            for entry in feed.entries:
-                if len(candidates) >= cfg.candidates_per_query:
-                    break
-                # Articles are excluded if the title contains any EXCLUDE KEYWORDS
-                if any(kw in entry.title for kw in EXCLUDE_KEYWORDS):
-                    continue
-                
-                # Decode URL (RSS URL -> Original URL)
-                url = decode_url(entry.link)
-                if url in seen_urls:
-                    continue
-                
-                # Fetch Article Content
-                content = fetch_article(url, article_config)
-                if not content:
-                    continue
-                
-                #Calculate Score of Article
-                score = calculate_score(entry.title, content)
-                candidates.append({
-                    "category": cat["category"],
-                    "company": company,
-                    "title": entry.title,
-                    "published": entry.published,
-                    "link": url,
-                    "content": content,
-                    "score": score
-                })
-                print(f"    📰 {entry.title[:35]}... (점수: {score})")
+            candidates, skipped = collect_candidates(cat["category"], company, cfg, article_config,
+                                                     reported, seen_urls)
+            skipped_reported += skipped
             
             # Select the highest scored article among candidates
-            if candidates:
-                best = max(candidates, key=lambda x: x["score"])
+            best = pick_best(candidates, seen_urls)
+            if best:
                 seen_urls.add(best["link"])
                 results.append(best)
                 category_count += 1
@@ -272,6 +350,9 @@ def crawl_news(cfg: CrawlerConfig = CrawlerConfig()) -> pd.DataFrame:
                 print(f"    ⚠️ 뉴스 없음")
         
         print(f"\n  📊 {cat['category']}: {category_count}개")
+
+    if skipped_reported:
+        print(f"\n  ⏭️ 이미 보도한 기사 {skipped_reported}개 제외")
     
     return pd.DataFrame(results)
 
@@ -1,12 +1,11 @@
+import re
 import pandas as pd
 from typing import Optional
 from .openai_client import get_shared_client
+from .telemetry import create_message
 from .config import SELECTED_NEWS_FILE
 import anthropic
 
-# Get shared Anthropic client instance
-client = get_shared_client()
-
 # ============================================================
 # Configuration Constants
 # ============================================================
@@ -15,6 +14,16 @@ MODEL_NAME = "claude-sonnet-4-6"
 MAX_TOKENS = 2048
 TEMPERATURE = 0.3
 
+# Validation rules used to auto-accept summaries in batch mode
+SECTION_RE = re.compile(r'\[(Title|Summary\d*|Insight)\]', re.IGNORECASE)
+MAX_SECTION_CHARS = 300 # prompt asks for 100~200 characters; leave some slack
+
+# Optional framing of [Insight] for a specific team edition (inserted into the prompt)
+INSIGHT_FOCUS_TEMPLATE = """
+    <insight_focus>
+    Write [Insight] from this perspective: {focus}
+"""
+
 SYSTEM_PROMPT = (
     "You are a professional AI analyst specializing in Insurance and AI services. "
     "You write concise, structured, and business-oriented summaries in Korean."
@@ -59,7 +68,7 @@ USER_PROMPT_TEMPLATE = """
     [Insight]
     Suggest a concrete way this service or technology could be applied in our insurance company, along with expected benefits if applicable.
     (e.g., underwriting, claims, customer service, sales, marketing, risk management).
-
+{insight_focus}
     <article>
     {content}
     """
@@ -69,7 +78,7 @@ USER_PROMPT_TEMPLATE = """
 # ============================================================
 
 # Summarize Article Content
-def summarize_article(title: str, content: str) -> Optional[str]:
+def summarize_article(title: str, content: str, insight_focus: str = None) -> Optional[str]:
     if not content or len(content.strip()) < 50:
         print("      ⚠️ 콘텐츠가 없거나 너무 짧습니다 (최소 50자 필요).")
         return None
@@ -78,14 +87,22 @@ def summarize_article(title: str, content: str) -> Optional[str]:
         title = title.split(" - ")[0].strip()
 
     try:
-        response = client.messages.create(
+        # Client is built on first call (not at import) to keep startup fast
+        client = get_shared_client()
+        response = create_message(
+            client,
+            "news_summarize",
             model=MODEL_NAME,
             max_tokens=MAX_TOKENS,
             system=SYSTEM_PROMPT,
             messages=[
                 {
                     "role": "user",
-                    "content": USER_PROMPT_TEMPLATE.format(title=title, content=content)
+                    "content": USER_PROMPT_TEMPLATE.format(
+                        title=title,
+                        content=content,
+                        insight_focus=INSIGHT_FOCUS_TEMPLATE.format(focus=insight_focus) if insight_focus else ""
+                    )
                 }
             ]
         )
@@ -113,12 +130,8 @@ def summarize_article(title: str, content: str) -> Optional[str]:
         return None
 
 
-# Summarize the articles in the DataFrame and return a combined string
-def summarize_articles(df: pd.DataFrame) -> Optional[str]:
-    if df.empty:
-        print("⚠️ 요약할 기사가 없습니다.")
-        return None
-    
+# Summarize every article in the DataFrame (no user interaction)
+def generate_summaries(df: pd.DataFrame) -> list:
     all_summaries = []
     total = len(df)
     
@@ -138,6 +151,11 @@ def summarize_articles(df: pd.DataFrame) -> Optional[str]:
             "summary": summary
         })
     
+    return all_summaries
+
+
+# Show generated summaries and return the ones chosen by the user as a combined string
+def choose_summaries(all_summaries: list) -> Optional[str]:
     # Check if any summaries were successfully generated
     if not all_summaries:
         print("\n❌ 모든 기사 요약이 실패했습니다. 프로세스를 종료합니다.")
@@ -199,6 +217,54 @@ def summarize_articles(df: pd.DataFrame) -> Optional[str]:
     return combined
 
 
+# Return a list of problems found in a summary (empty list = valid)
+def validate_summary(summary: str) -> list:
+    problems = []
+    tags = [t.lower() for t in SECTION_RE.findall(summary)]
+
+    if "title" not in tags:
+        problems.append("[Title] 없음")
+    if not any(t.startswith("summary") for t in tags):
+        problems.append("[Summary] 없음")
+    if "insight" not in tags:
+        problems.append("[Insight] 없음")
+
+    for section in SECTION_RE.split(summary)[2::2]:
+        if not section.strip():
+            problems.append("빈 섹션")
+        elif len(section.strip()) > MAX_SECTION_CHARS:
+            problems.append(f"섹션이 너무 김 ({len(section.strip())}자)")
+
+    return problems
+
+
+# Accept every summary that passes validation (batch mode, no user input)
+def auto_choose_summaries(all_summaries: list) -> Optional[str]:
+    results = []
+    for item in all_summaries:
+        problems = validate_summary(item["summary"])
+        if problems:
+            print(f"  ⚠️ [{item['index']}] 검증 실패로 제외: {', '.join(problems)}")
+        else:
+            results.append(item["summary"])
+
+    if not results:
+        print("\n❌ 검증을 통과한 요약이 없습니다.")
+        return None
+
+    print(f"\n✅ {len(results)}개 요약이 자동 선택되었습니다!")
+    return "\n\n".join(results)
+
+
+# Summarize the articles in the DataFrame and return a combined string
+def summarize_articles(df: pd.DataFrame) -> Optional[str]:
+    if df.empty:
+        print("⚠️ 요약할 기사가 없습니다.")
+        return None
+
+    return choose_summaries(generate_summaries(df))
+
+
 # Test (If needed)
 if __name__ == "__main__":
 
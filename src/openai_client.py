@@ -2,6 +2,7 @@
 Shared Anthropic client configuration and initialization.
 """
 import os
+import threading
 import httpx
 import anthropic
 from dotenv import load_dotenv
@@ -32,6 +33,7 @@ def get_claude_client() -> anthropic.Anthropic:
 
 # Create a singleton instance for reuse across modules
 _client_instance = None
+_client_lock = threading.Lock() # parallel first calls (e.g. AI Lab chunks) must not build several clients
 
 
 def get_shared_client() -> anthropic.Anthropic:
@@ -43,5 +45,7 @@ def get_shared_client() -> anthropic.Anthropic:
     """
     global _client_instance
     if _client_instance is None:
-        _client_instance = get_claude_client()
+        with _client_lock:
+            if _client_instance is None:
+                _client_instance = get_claude_client()
     return _client_instance
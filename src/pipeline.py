@@ -0,0 +1,246 @@
+"""
+Dependency-graph (DAG) pipeline scheduler.
+
+Independent stages run concurrently on daemon threads. Interactive stages
+(input() prompts) are barrier nodes: they wait until no other stage is
+running and then run alone on the main thread.
+
+With a RunStore (src/checkpoint.py), every stage output is saved to the run
+directory and stages whose inputs are unchanged are loaded instead of re-run.
+With a StageProfiler (src/profiling.py), every stage runs under cProfile and
+tracemalloc.
+"""
+import threading
+import time
+from concurrent.futures import Future, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+# ============================================================
+# Settings
+# ============================================================
+
+MAX_WORKERS = 4 # max number of stages running at the same time
+PROGRESS_INTERVAL = 10.0 # seconds between "in progress" lines while stages are running
+
+
+class StageError(Exception):
+    """Raised by a stage to stop the pipeline with a user-facing message."""
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Callable[[dict], Any] # receives results of finished stages ({name: result})
+    deps: list = field(default_factory=list)
+    barrier: bool = False # interactive stage: runs alone on the main thread
+    label: str = "" # name shown in progress output
+    fingerprint: Callable[[], str] = None # hash of external inputs (e.g. source files) for resume checks
+
+
+@dataclass
+class StageTiming:
+    start: float = 0.0
+    end: float = 0.0
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+# ============================================================
+# Progress Output
+# ============================================================
+_print_lock = threading.Lock()
+_cancelled = threading.Event()
+
+
+# True once the pipeline failed or was interrupted; long stages (crawl, AI Lab chunks) check it
+# between units of work and stop early
+def is_cancelled() -> bool:
+    return _cancelled.is_set()
+
+
+def _progress(message: str):
+    with _print_lock:
+        print(message, flush=True)
+
+
+def _run_stage(stage: Stage, results: dict, timings: dict, store=None, input_hash: str = "", profiler=None):
+    timings[stage.name] = StageTiming(start=time.perf_counter())
+    _progress(f"\n▶ [{stage.label or stage.name}] 시작")
+    try:
+        if profiler is None:
+            result = stage.func(results)
+        else:
+            with profiler.profile(stage.name):
+                result = stage.func(results)
+    except Exception as e:
+        if store is not None:
+            store.mark_failed(stage.name, e)
+        raise
+    finally:
+        timings[stage.name].end = time.perf_counter()
+
+    if store is not None:
+        store.save(stage.name, result, input_hash)
+    return result
+
+
+# Run a stage on a daemon thread (unlike ThreadPoolExecutor workers, these are not joined at
+# interpreter exit, so sys.exit() after a failed stage does not wait for the others)
+def _start_stage(stage: Stage, results: dict, timings: dict, store, input_hash: str, profiler) -> Future:
+    future = Future()
+    future.set_running_or_notify_cancel()
+    timings[stage.name] = StageTiming(start=time.perf_counter()) # progress lines may read it before the thread starts
+
+    def target():
+        try:
+            future.set_result(_run_stage(stage, results, timings, store, input_hash, profiler))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=target, name=f"stage-{stage.name}", daemon=True).start()
+    return future
+
+
+# Load the stage from the run directory if it already finished with the same inputs
+def _try_resume(stage: Stage, results: dict, timings: dict, store) -> bool:
+    if store is None or stage.name not in store.manifest["stages"]:
+        return False
+
+    input_hash = _input_hash(stage, store)
+    if not store.is_complete(stage.name, input_hash):
+        return False
+
+    results[stage.name] = store.load(stage.name)
+    now = time.perf_counter()
+    timings[stage.name] = StageTiming(start=now, end=now)
+    _progress(f"⏭️ [{stage.label or stage.name}] 체크포인트에서 불러옴 (건너뜀)")
+    return True
+
+
+def _input_hash(stage: Stage, store) -> str:
+    fingerprint = stage.fingerprint() if stage.fingerprint else ""
+    return store.input_hash(stage.name, stage.deps, fingerprint)
+
+
+# ============================================================
+# Critical Path
+# ============================================================
+
+# Longest chain of dependent stages by duration (the path that bounds total wall time)
+def critical_path(stages: list, timings: dict) -> list:
+    by_name = {s.name: s for s in stages}
+    memo = {}
+
+    def longest(name):
+        if name not in memo:
+            stage = by_name[name]
+            best = max((longest(d) for d in stage.deps), key=lambda p: p[0], default=(0.0, []))
+            memo[name] = (best[0] + timings[name].duration, best[1] + [name])
+        return memo[name]
+
+    return max((longest(s.name) for s in stages if s.name in timings), key=lambda p: p[0], default=(0.0, []))[1]
+
+
+def print_timing_report(stages: list, timings: dict, wall_time: float):
+    by_name = {s.name: s for s in stages}
+    path = critical_path(stages, timings)
+
+    print("\n" + "="*60)
+    print("⏱️ 단계별 소요 시간")
+    print("="*60)
+    for stage in stages:
+        if stage.name in timings:
+            mark = "★" if stage.name in path else " "
+            kind = " (interactive)" if stage.barrier else ""
+            print(f"  {mark} {stage.label or stage.name:<20} {timings[stage.name].duration:8.1f}s{kind}")
+
+    path_time = sum(timings[name].duration for name in path)
+    print(f"\n  🧭 Critical path: {' → '.join(by_name[n].label or n for n in path)} ({path_time:.1f}s)")
+    print(f"  ⌛ 전체 소요 시간: {wall_time:.1f}s")
+
+
+# ============================================================
+# Scheduler
+# ============================================================
+
+# Run stages respecting dependencies and return {stage name: result}
+# (store: optional RunStore for checkpoint / resume, timings: dict filled with {name: StageTiming},
+#  profiler: optional StageProfiler; stages then run one at a time so CPU and memory are attributed
+#  to a single stage)
+def run_pipeline(stages: list, max_workers: int = MAX_WORKERS, report: bool = True, store=None,
+                 timings: dict = None, profiler=None) -> dict:
+    names = {s.name for s in stages}
+    for stage in stages:
+        missing = [d for d in stage.deps if d not in names]
+        if missing:
+            raise ValueError(f"'{stage.name}' 단계의 의존 단계가 없습니다: {missing}")
+
+    results = {}
+    timings = {} if timings is None else timings
+    pending = list(stages)
+    running = {}
+    wall_start = time.perf_counter()
+    if profiler is not None:
+        max_workers = 1
+    _cancelled.clear()
+
+    try:
+        while pending or running:
+            ready = [s for s in pending if all(d in results for d in s.deps)]
+
+            # Completed stages of a resumed run are loaded instead of re-run
+            resumed = [s for s in ready if _try_resume(s, results, timings, store)]
+            if resumed:
+                for stage in resumed:
+                    pending.remove(stage)
+                continue
+
+            barriers = [s for s in ready if s.barrier]
+
+            # Barrier: wait until nothing else is running, then run on the main thread
+            if barriers and not running:
+                stage = barriers[0]
+                pending.remove(stage)
+                input_hash = _input_hash(stage, store) if store is not None else ""
+                results[stage.name] = _run_stage(stage, results, timings, store, input_hash, profiler)
+                _progress(f"✅ [{stage.label or stage.name}] 완료 ({timings[stage.name].duration:.1f}s)")
+                continue
+
+            # Submit ready non-interactive stages (at most max_workers at a time)
+            for stage in ready:
+                if not stage.barrier and len(running) < max_workers:
+                    pending.remove(stage)
+                    input_hash = _input_hash(stage, store) if store is not None else ""
+                    running[_start_stage(stage, results, timings, store, input_hash, profiler)] = stage
+
+            if not running:
+                if pending:
+                    raise ValueError(f"실행할 수 없는 단계가 있습니다 (순환 의존성): {[s.name for s in pending]}")
+                break
+
+            done, _ = wait(running, timeout=PROGRESS_INTERVAL, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                results[stage.name] = future.result() # re-raises StageError from the stage
+                _progress(f"✅ [{stage.label or stage.name}] 완료 ({timings[stage.name].duration:.1f}s)")
+
+            # Printed after every completion and every PROGRESS_INTERVAL while stages keep running
+            if running:
+                now = time.perf_counter()
+                status = ", ".join(
+                    f"{s.label or s.name} {now - timings[s.name].start:.1f}s" for s in running.values()
+                )
+                _progress(f"⏳ 진행 중: {status}")
+    except BaseException:
+        # Stages run on daemon threads, so a failure or Ctrl+C exits without waiting for a long crawl;
+        # the cancel flag also stops their thread pools / loops at the next unit of work
+        _cancelled.set()
+        raise
+
+    if report:
+        print_timing_report(stages, timings, time.perf_counter() - wall_start)
+
+    return results
@@ -1,6 +1,18 @@
+import posixpath
 import re
+import struct
+import sys
+import threading
+import time
+import tracemalloc
+import zipfile
+from copy import copy, deepcopy
 from pathlib import Path
+from lxml import etree
 from pptx import Presentation
+from pptx.opc.oxml import serialize_part_xml
+from pptx.oxml import parse_xml
+from pptx.shapes.shapetree import SlideShapes
 from pptx.util import Pt
 from pptx.dml.color import RGBColor
 from .config import PPT_TEMPLATE_FILE
@@ -18,6 +30,15 @@ TAG_STYLES = {
 }
 DEFAULT_STYLE = ("", "한화고딕 EL", 12, False, True)
 
+# Placeholder shapes to fill, addressed by key instead of shape index.
+# A shape whose alt text (description) equals the key is used first; otherwise the
+# shape name below is used ("name#2" = second shape with the same name).
+SHAPE_KEYS = {
+    "number_date": "TextBox 1",  # 제N호 | 날짜
+    "news":        "TextBox 2",  # AI News
+    "ailab":       "TextBox 2#2", # AI LAB
+}
+
 
 # ============================================================
 # Utility Functions
@@ -55,6 +76,31 @@ def find_shape_by_index(prs: Presentation, shape_index: int, slide_index: int =
     return slide, shapes[shape_index]
 
 
+# Build {key: shape} for slide shapes: alt text tags and shape names ("name#2" for duplicates)
+def index_shapes(shapes) -> dict:
+    index, name_counts = {}, {}
+    for shape in shapes:
+        name = getattr(shape, "name", "")
+        name_counts[name] = name_counts.get(name, 0) + 1
+        key = name if name_counts[name] == 1 else f"{name}#{name_counts[name]}"
+        index.setdefault(key, shape)
+
+        descr = shape._element._nvXxPr.cNvPr.get("descr", "").strip()
+        if descr:
+            index.setdefault(f"tag:{descr}", shape)
+    return index
+
+
+# Return the placeholder shape for a key in SHAPE_KEYS (alt text tag first, then name)
+def find_placeholder(shape_index: dict, key: str, slide_index: int = 0):
+    shape = shape_index.get(f"tag:{key}") or shape_index.get(SHAPE_KEYS.get(key, key))
+    if shape is None:
+        raise ValueError(f"슬라이드 {slide_index}에서 '{key}' shape을 찾지 못했습니다.")
+    if not shape.has_text_frame:
+        raise ValueError(f"'{key}' shape에 text_frame이 없습니다.")
+    return shape
+
+
 # Add a styled text run
 def add_styled_run(paragraph, text, font_name, font_size, underline=False, color=None):
     r = paragraph.add_run()
@@ -70,17 +116,8 @@ def add_styled_run(paragraph, text, font_name, font_size, underline=False, color
 # Write PPT
 # ============================================================
 
-# Add report number and date
-def set_number_and_date(prs: Presentation, number: str, date: str, 
-                        shape_index: int = 4, slide_index: int = 0):
-    """숫자와 날짜를 특정 TextBox에 입력"""
-    _, shape = find_shape_by_index(prs, shape_index, slide_index)
-    
-    if not shape:
-        raise ValueError(f'슬라이드 {slide_index}의 {shape_index}번째 shape을 찾지 못했습니다.')
-    if not shape.has_text_frame:
-        raise ValueError(f'{shape_index}번째 shape에 text_frame이 없습니다.')
-
+# Write "제N호 | 날짜" into a text shape
+def fill_number_and_date(shape, number: str, date: str):
     tf = shape.text_frame
     tf.clear()
     
@@ -90,17 +127,8 @@ def set_number_and_date(prs: Presentation, number: str, date: str,
     add_styled_run(p, combined_text, "한화고딕 L", 11, color=RGBColor(0x6C, 0x6A, 0x67))
 
 
-# Insert summarized text structured with tag-specific styles
-def set_textbox_from_summarizedtxt(prs: Presentation, text: str, 
-                                    shape_index: int = 13, slide_index: int = 0):
-    # Find specific index shape
-    _, shape = find_shape_by_index(prs, shape_index, slide_index)
-    
-    if not shape:
-        raise ValueError(f'슬라이드 {slide_index}의 {shape_index}번째 shape을 찾지 못했습니다.')
-    if not shape.has_text_frame:
-        raise ValueError(f'{shape_index}번째 shape에 text_frame이 없습니다.')
-
+# Write summarized text structured with tag-specific styles into a text shape
+def fill_summary_textbox(shape, text: str):
     # Clear existing text frame
     tf = shape.text_frame
     tf.clear()
@@ -127,33 +155,240 @@ def set_textbox_from_summarizedtxt(prs: Presentation, text: str,
             add_styled_run(tf.add_paragraph(), " ", "한화고딕 EL", 9)
 
 
+def _get_text_shape(prs: Presentation, shape_index: int, slide_index: int):
+    _, shape = find_shape_by_index(prs, shape_index, slide_index)
+    
+    if not shape:
+        raise ValueError(f'슬라이드 {slide_index}의 {shape_index}번째 shape을 찾지 못했습니다.')
+    if not shape.has_text_frame:
+        raise ValueError(f'{shape_index}번째 shape에 text_frame이 없습니다.')
+    return shape
+
+
+# Add report number and date
+def set_number_and_date(prs: Presentation, number: str, date: str, 
+                        shape_index: int = 4, slide_index: int = 0):
+    """숫자와 날짜를 특정 TextBox에 입력"""
+    fill_number_and_date(_get_text_shape(prs, shape_index, slide_index), number, date)
+
+
+# Insert summarized text structured with tag-specific styles
+def set_textbox_from_summarizedtxt(prs: Presentation, text: str, 
+                                    shape_index: int = 13, slide_index: int = 0):
+    fill_summary_textbox(_get_text_shape(prs, shape_index, slide_index), text)
+
+
+# ============================================================
+# Compiled Template
+# ============================================================
+
+# Template parsed once and reused for every report.
+# Rendering edits only the placeholder text bodies, saves, then restores them,
+# so each report costs a save instead of a full re-parse of the template.
+class CompiledTemplate:
+    def __init__(self, pptx_path: str, slide_index: int = 0):
+        self.path = Path(pptx_path)
+        self.prs = Presentation(str(self.path))
+        self.slide_index = slide_index
+        self.shapes = index_shapes(self.prs.slides[slide_index].shapes)
+        self._lock = threading.Lock()
+
+    def find_shape(self, key: str):
+        return find_placeholder(self.shapes, key, self.slide_index)
+
+    def render(self, pptx_out: str, number: str, date: str, text1: str, text2: str):
+        with self._lock:
+            targets = [self.find_shape(key) for key in ("number_date", "news", "ailab")]
+            # Cheap clone: keep a copy of only the text bodies that are about to change
+            originals = [(shape, deepcopy(shape.text_frame._txBody)) for shape in targets]
+            try:
+                fill_number_and_date(targets[0], number, date)
+                fill_summary_textbox(targets[1], text1)
+                fill_summary_textbox(targets[2], text2)
+                self.prs.save(pptx_out)
+            finally:
+                for shape, txBody in originals:
+                    current = shape.text_frame._txBody
+                    current.getparent().replace(current, txBody)
+
+
+# ============================================================
+# Streaming XML Writer
+# ============================================================
+PRESENTATION_PART = "ppt/presentation.xml"
+PRESENTATION_RELS = "ppt/_rels/presentation.xml.rels"
+NS = {
+    "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    "r": "http://schemas.openxmlformats.org/officeDocument/2006/relationships",
+    "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
+}
+
+
+# Zip entry name of the slide XML at slide_index (presentation.xml slide order)
+def get_slide_part_name(zin: zipfile.ZipFile, slide_index: int = 0) -> str:
+    presentation = etree.fromstring(zin.read(PRESENTATION_PART))
+    slide_ids = presentation.xpath("./p:sldIdLst/p:sldId", namespaces=NS)
+    if slide_index >= len(slide_ids):
+        raise ValueError(f"슬라이드 {slide_index}을 찾지 못했습니다.")
+    rid = slide_ids[slide_index].get(f"{{{NS['r']}}}id")
+
+    rels = etree.fromstring(zin.read(PRESENTATION_RELS))
+    target = rels.xpath(f"./rel:Relationship[@Id='{rid}']/@Target", namespaces=NS)[0]
+    return posixpath.normpath(posixpath.join("ppt", target))
+
+
+# write_raw_entry() appends to private ZipFile state (fp, filelist, NameToInfo, start_dir, _didModify);
+# checked on these versions only (tests/test_ppt_maker.py). Others copy the decompressed entries instead.
+RAW_COPY_SUPPORTED = (3, 8) <= sys.version_info[:2] <= (3, 13)
+
+
+# Compressed bytes of a zip entry, exactly as stored in the archive
+def read_raw_entry(zin: zipfile.ZipFile, info: zipfile.ZipInfo) -> bytes:
+    zin.fp.seek(info.header_offset)
+    header = zin.fp.read(zipfile.sizeFileHeader)
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    zin.fp.seek(info.header_offset + zipfile.sizeFileHeader + name_len + extra_len)
+    return zin.fp.read(info.compress_size)
+
+
+# Append an entry with already-compressed bytes (no decompress / recompress)
+def write_raw_entry(zout: zipfile.ZipFile, info: zipfile.ZipInfo, raw: bytes):
+    zinfo = copy(info)
+    zinfo.flag_bits &= ~0x08 # sizes and CRC go in the local header, no data descriptor
+    zinfo.header_offset = zout.fp.tell()
+    zout.fp.write(zinfo.FileHeader())
+    zout.fp.write(raw)
+    zout.filelist.append(zinfo)
+    zout.NameToInfo[zinfo.filename] = zinfo
+    zout.start_dir = zout.fp.tell()
+    zout._didModify = True
+
+
+# Template zip read once: the slide XML to fill plus the compressed bytes of every other entry.
+# Rendering parses only the slide XML and copies the other entries' bytes unchanged.
+# Shared across threads: render() never modifies the cached entries (zipfile rewrites the
+# ZipInfo passed to writestr, so it gets a copy).
+class XmlTemplate:
+    def __init__(self, pptx_path: str, slide_index: int = 0):
+        self.path = Path(pptx_path)
+        self.slide_index = slide_index
+        with zipfile.ZipFile(self.path) as zin:
+            self.slide_part = get_slide_part_name(zin, slide_index)
+            self.slide_xml = zin.read(self.slide_part)
+            # [(ZipInfo, compressed bytes or None for the slide part)] in template order
+            # (decompressed bytes where raw copies are not supported)
+            read = read_raw_entry if RAW_COPY_SUPPORTED else zipfile.ZipFile.read
+            self.entries = [
+                (info, None if info.filename == self.slide_part else read(zin, info))
+                for info in zin.infolist()
+            ]
+
+    def render(self, pptx_out: str, number: str, date: str, text1: str, text2: str):
+        # Same shape objects / styling code as the python-pptx path, on the slide XML only
+        slide = parse_xml(self.slide_xml)
+        shapes = index_shapes(SlideShapes(slide.cSld.spTree, None))
+        fill_number_and_date(find_placeholder(shapes, "number_date", self.slide_index), number, date)
+        fill_summary_textbox(find_placeholder(shapes, "news", self.slide_index), text1)
+        fill_summary_textbox(find_placeholder(shapes, "ailab", self.slide_index), text2)
+
+        with zipfile.ZipFile(pptx_out, "w") as zout:
+            for info, raw in self.entries:
+                if raw is None:
+                    zout.writestr(copy(info), serialize_part_xml(slide), compress_type=info.compress_type)
+                elif RAW_COPY_SUPPORTED:
+                    write_raw_entry(zout, info, raw)
+                else:
+                    zout.writestr(copy(info), raw, compress_type=info.compress_type)
+
+
+_template_cache = {}
+_template_cache_lock = threading.Lock()
+
+
+# Return the template of the given kind for a path (re-compiled only when the file changes)
+def _get_cached_template(kind: type, pptx_path: str):
+    path = Path(pptx_path).resolve()
+    key = (kind, path, path.stat().st_mtime_ns)
+    with _template_cache_lock:
+        if key not in _template_cache:
+            _template_cache[key] = kind(str(path))
+        return _template_cache[key]
+
+
+def get_compiled_template(pptx_path: str) -> CompiledTemplate:
+    return _get_cached_template(CompiledTemplate, pptx_path)
+
+
+def get_xml_template(pptx_path: str) -> XmlTemplate:
+    return _get_cached_template(XmlTemplate, pptx_path)
+
+
+# Write the report from the cached template zip, regenerating only the slide XML that holds
+# the number/date and summary boxes. Other entries keep the template's compressed bytes.
+def render_report_xml(pptx_in: str, pptx_out: str, number: str, date: str,
+                      text1: str, text2: str):
+    get_xml_template(pptx_in).render(pptx_out, number, date, text1, text2)
+
+
 # ============================================================
 # Main Function
 # ============================================================
 # Create Report PPTX
+# fast=True: streaming XML writer (only the slide part is rewritten)
+# fast=False: python-pptx save of the compiled template
 def create_report(pptx_in: str, pptx_out: str, number: str, date: str,
-                  text1: str, text2: str):
+                  text1: str, text2: str, fast: bool = True):
 
     # Check if template file exists
     if not Path(pptx_in).exists():
         raise FileNotFoundError(f"❌ PPT 템플릿 파일을 찾을 수 없습니다: {pptx_in}")
 
-    prs = Presentation(pptx_in)
-    
-    # Step 1: Enter number of the report and date.
-    set_number_and_date(prs, number, date, shape_index=4, slide_index=0)
-    
-    # Step 2: Enter first summary text
-    set_textbox_from_summarizedtxt(prs, text1, shape_index=13, slide_index=0)
-    
-    # Step 3: Enter second summary text
-    set_textbox_from_summarizedtxt(prs, text2, shape_index=14, slide_index=0)
-    
-    # Save
-    prs.save(pptx_out)
+    # Number/date, first summary and second summary
+    if fast:
+        render_report_xml(pptx_in, pptx_out, number, date, text1, text2)
+    else:
+        get_compiled_template(pptx_in).render(pptx_out, number, date, text1, text2)
     print(f"  💾 {pptx_out} 저장 완료!")
 
 
+# Reports/sec and peak memory: re-parse per report vs. compiled template vs. streaming XML writer
+def benchmark_reports(pptx_in: str = str(PPT_TEMPLATE_FILE), pptx_out: str = "bench_output.pptx", n: int = 20):
+    text1 = "[Title] 벤치마크 제목\n[Summary1] 요약1 내용\n[Summary2] 요약2 내용\n[Insight] 인사이트 내용"
+    text2 = "[Title] AI Lab 벤치마크\n[Summary1] AI Lab 요약1\n[Summary2] AI Lab 요약2"
+
+    def reparse():
+        prs = Presentation(pptx_in)
+        set_number_and_date(prs, "0", "2025년 1월 1일", shape_index=4, slide_index=0)
+        set_textbox_from_summarizedtxt(prs, text1, shape_index=13, slide_index=0)
+        set_textbox_from_summarizedtxt(prs, text2, shape_index=14, slide_index=0)
+        prs.save(pptx_out)
+
+    template = CompiledTemplate(pptx_in)
+    renderers = [
+        ("re-parse per report", reparse),
+        ("compiled template", lambda: template.render(pptx_out, "0", "2025년 1월 1일", text1, text2)),
+        ("streaming XML writer", lambda: render_report_xml(pptx_in, pptx_out, "0", "2025년 1월 1일", text1, text2)),
+    ]
+
+    results = {}
+    for label, render in renderers:
+        start = time.perf_counter()
+        for _ in range(n):
+            render()
+        rate = n / (time.perf_counter() - start)
+
+        tracemalloc.start()
+        render()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        results[label] = (rate, peak)
+        print(f"  📈 {label:<22}: {rate:8.1f} reports/sec, peak {peak / 1024:8.1f} KiB")
+
+    Path(pptx_out).unlink(missing_ok=True)
+    return results
+
+
 # For debugging: output shape information for all slides
 def list_all_shapes(pptx_path: str):
     prs = Presentation(pptx_path)
@@ -0,0 +1,153 @@
+"""
+Relevance pre-screen of crawled candidates with a small, fast model.
+
+calculate_score() only counts keywords. prescreen_articles() sends the title
+and lead of every candidate to claude-haiku-4-5 in one batched call and adds
+an "ai_score" (0-10) and a one-line "ai_reason" column, shown next to "score"
+in the selection table. Results are cached per article URL, so re-running the
+selection only sends articles that were not screened before.
+"""
+import json
+import re
+from pathlib import Path
+from .openai_client import get_shared_client
+from .telemetry import create_message
+from .config import PRESCREEN_CACHE_FILE
+import anthropic
+import pandas as pd
+
+# ============================================================
+# Configuration Constants
+# ============================================================
+
+MODEL_NAME = "claude-haiku-4-5"
+TEMPERATURE = 0.0
+LEAD_CHARS = 300 # characters of the article body sent with each title
+TOKENS_PER_ARTICLE = 60 # output budget per article (score + one-line reason)
+
+SYSTEM_PROMPT = (
+    "You are a news editor for an internal AI weekly report of an insurance company. "
+    "You rate how relevant news articles are for the report."
+)
+
+USER_PROMPT_TEMPLATE = """
+    <task>
+    Rate each article below for an AI weekly report read by an insurance company.
+
+    <requirements>
+    1. Give each article a relevance score from 0 to 10.
+      - 8~10: concrete AI adoption, product or partnership by an insurer or a major AI company
+      - 4~7: AI industry news with a plausible insurance use case
+      - 0~3: AI only mentioned in passing, ads, events, stock news
+    2. Give ONE short Korean reason (within 40 characters) per article.
+    3. Output exactly one line per article, in the same order, and nothing else.
+
+    <output_format>
+    [id] score | reason
+
+    <articles>
+    {articles}
+    """
+
+LINE_RE = re.compile(r"^\s*\[?(\d+)\]?\s*[.:)]?\s*(\d+(?:\.\d+)?)\s*\|\s*(.+?)\s*$")
+
+# ============================================================
+# Utility Functions
+# ============================================================
+
+def load_cache(cache_file: Path = None) -> dict:
+    cache_file = Path(cache_file or PRESCREEN_CACHE_FILE)
+    if not cache_file.exists():
+        return {}
+    try:
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+    except Exception:
+        return {} # broken cache -> screen again
+
+
+def save_cache(cache: dict, cache_file: Path = None):
+    cache_file = Path(cache_file or PRESCREEN_CACHE_FILE)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps(cache, ensure_ascii=False, indent=1), encoding="utf-8")
+    except Exception as e:
+        print(f"⚠️ 사전 평가 캐시 저장 실패: {e}")
+
+
+def format_articles(rows: list) -> str:
+    lines = []
+    for i, row in enumerate(rows, 1):
+        lead = " ".join(str(row.get("content", "") or "").split())[:LEAD_CHARS]
+        lines.append(f"[{i}] {row['title']}\n    {lead}")
+    return "\n".join(lines)
+
+
+# "[3] 8 | 보험 청구 자동화 사례" -> {3: (8, "보험 청구 자동화 사례")}
+def parse_response(text: str) -> dict:
+    parsed = {}
+    for line in text.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            score = max(0, min(10, round(float(match.group(2)))))
+            parsed[int(match.group(1))] = (score, match.group(3))
+    return parsed
+
+
+# ============================================================
+# Functions
+# ============================================================
+
+# Screen candidates that are not cached yet in one call; returns {url: {"score", "reason"}}
+def screen_candidates(rows: list) -> dict:
+    if not rows:
+        return {}
+
+    try:
+        client = get_shared_client()
+        message = create_message(
+            client, "prescreen",
+            model=MODEL_NAME,
+            max_tokens=TOKENS_PER_ARTICLE * len(rows) + 256,
+            temperature=TEMPERATURE,
+            system=SYSTEM_PROMPT,
+            messages=[{"role": "user", "content": USER_PROMPT_TEMPLATE.format(articles=format_articles(rows))}],
+        )
+    except anthropic.APIError as e:
+        print(f"⚠️ 사전 평가 Claude API 오류: {e}")
+        return {}
+    except Exception as e:
+        print(f"⚠️ 사전 평가 중 예상치 못한 오류 발생: {e}")
+        return {}
+
+    parsed = parse_response(message.content[0].text if message.content else "")
+    return {
+        row["link"]: {"score": parsed[i][0], "reason": parsed[i][1], "model": MODEL_NAME}
+        for i, row in enumerate(rows, 1)
+        if i in parsed
+    }
+
+
+# Add "ai_score" / "ai_reason" columns to the crawled DataFrame (articles that could not be
+# screened keep empty values, so the selection still works when the call fails)
+def prescreen_articles(df, cache_file: Path = None):
+    if df.empty:
+        return df
+
+    cache = load_cache(cache_file)
+    rows = [row for _, row in df.iterrows() if row["link"] not in cache]
+
+    if rows:
+        print(f"  🔎 {MODEL_NAME}로 기사 {len(rows)}개 사전 평가 중... (캐시 {len(df) - len(rows)}개)")
+        screened = screen_candidates(rows)
+        if len(screened) < len(rows):
+            print(f"  ⚠️ {len(rows) - len(screened)}개 기사는 사전 평가 결과가 없습니다.")
+        if screened:
+            cache.update(screened)
+            save_cache(cache, cache_file)
+    else:
+        print(f"  🔎 기사 {len(df)}개 모두 캐시된 사전 평가 사용")
+
+    df = df.copy()
+    df["ai_score"] = pd.array([cache.get(link, {}).get("score") for link in df["link"]], dtype="Int64")
+    df["ai_reason"] = [cache.get(link, {}).get("reason", "") for link in df["link"]]
+    return df
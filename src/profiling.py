@@ -0,0 +1,140 @@
+"""
+Per-stage CPU and memory profiling (python main.py --profile).
+
+Each pipeline stage runs under cProfile with tracemalloc tracking its peak
+memory, measured above the memory still held when the stage starts (the
+absolute traced peak is reported next to it). <name>.pstats is written per stage (open with `python -m pstats` or
+snakeviz), and summary.txt ranks the hotspots per stage. Self time is also
+grouped by package, so newspaper parsing, pandas, python-pptx and network waits
+(ssl / socket reads) can be told apart at a glance.
+
+cProfile only sees the thread that runs the stage: work done in a stage's own
+thread pool (parallel Claude calls, AI Lab chunks) shows up as time waiting on
+those threads, while the tracemalloc peak includes them.
+"""
+import cProfile
+import io
+import pstats
+import re
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+# ============================================================
+# Settings
+# ============================================================
+
+TOP_N = 20 # hotspots listed per stage in summary.txt
+CONSOLE_TOP_N = 3 # hotspots printed per stage at the end of the run
+
+BUILTIN_RE = re.compile(r"(?:of '|built-in method )(\w+)\.")
+
+
+# "…/site-packages/newspaper/article.py" -> "newspaper", "…/lib/python3.11/ssl.py" -> "ssl",
+# "<method 'recv' of '_socket.socket' objects>" -> "_socket", "<built-in method marshal.loads>" -> "marshal"
+def package_of(key: tuple) -> str:
+    filename, _, func = key
+    if filename == "~":
+        match = BUILTIN_RE.search(func)
+        return match.group(1) if match else "builtins"
+    path = Path(filename)
+    parts = path.parts
+    if "site-packages" in parts:
+        return parts[parts.index("site-packages") + 1].split(".")[0]
+    if "src" in parts:
+        return "src." + path.stem
+    return path.stem
+
+
+def function_label(key: tuple) -> str:
+    filename, line, func = key
+    if filename == "~":
+        return func
+    return f"{Path(filename).name}:{line}({func})"
+
+
+class StageProfiler:
+    def __init__(self, out_dir: Path, top_n: int = TOP_N):
+        self.out_dir = Path(out_dir)
+        self.top_n = top_n
+        self.stages = {} # {stage name: {"seconds", "peak_mb", "abs_peak_mb", "stats"}}
+
+    # Profile one stage; used by pipeline._run_stage around stage.func(results)
+    @contextmanager
+    def profile(self, name: str):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        # reset_peak() sets the peak to the current traced size, so the stage's own peak is peak - start
+        tracemalloc.reset_peak()
+        start_bytes, _ = tracemalloc.get_traced_memory()
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            seconds = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+
+            self.out_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(self.out_dir / f"{name}.pstats")
+            self.stages[name] = {
+                "seconds": seconds,
+                "peak_mb": (peak - start_bytes) / 1024 / 1024,
+                "abs_peak_mb": peak / 1024 / 1024,
+                "stats": pstats.Stats(profiler),
+            }
+
+    # Write summary.txt and print the short per-stage report
+    def write_report(self) -> Path:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        if not self.stages:
+            return None
+
+        lines = []
+        for name, data in self.stages.items():
+            entries = data["stats"].stats # {(file, line, func): (cc, ncalls, tottime, cumtime, callers)}
+            ranked = sorted(entries.items(), key=lambda item: item[1][2], reverse=True)
+
+            by_package = {}
+            for key, (_, _, tottime, _, _) in entries.items():
+                package = package_of(key)
+                by_package[package] = by_package.get(package, 0.0) + tottime
+            packages = sorted(by_package.items(), key=lambda item: item[1], reverse=True)
+
+            lines.append("=" * 78)
+            lines.append(f"[{name}] {data['seconds']:.2f}s, peak memory +{data['peak_mb']:.1f} MB "
+                         f"(traced total {data['abs_peak_mb']:.1f} MB) ({name}.pstats)")
+            lines.append("=" * 78)
+            lines.append("self time by package:")
+            for package, tottime in packages[:10]:
+                lines.append(f"  {tottime:9.3f}s  {package}")
+            lines.append(f"\ntop {self.top_n} functions by self time:")
+            lines.append(f"  {'tottime':>9} {'cumtime':>9} {'ncalls':>9}  function")
+            for key, (_, ncalls, tottime, cumtime, _) in ranked[:self.top_n]:
+                lines.append(f"  {tottime:9.3f} {cumtime:9.3f} {ncalls:>9}  {function_label(key)}")
+
+            stream = io.StringIO()
+            data["stats"].stream = stream
+            data["stats"].sort_stats("cumulative").print_stats(self.top_n)
+            lines.append(f"\ntop {self.top_n} functions by cumulative time:")
+            lines.append(stream.getvalue().strip())
+            lines.append("")
+
+        summary_file = self.out_dir / "summary.txt"
+        summary_file.write_text("\n".join(lines), encoding="utf-8")
+
+        print("\n" + "="*60)
+        print("🔬 단계별 프로파일 (CPU self time / 최대 메모리)")
+        print("="*60)
+        for name, data in self.stages.items():
+            ranked = sorted(data["stats"].stats.items(), key=lambda item: item[1][2], reverse=True)
+            print(f"  {name:<12} {data['seconds']:8.1f}s  peak +{data['peak_mb']:7.1f} MB "
+                  f"(총 {data['abs_peak_mb']:.1f} MB)")
+            for key, (_, _, tottime, _, _) in ranked[:CONSOLE_TOP_N]:
+                print(f"      {tottime:7.2f}s  {function_label(key)}")
+        print(f"\n  📁 pstats / 요약: {self.out_dir}")
+        return summary_file
@@ -0,0 +1,77 @@
+"""
+Startup timing report based on `python -X importtime`.
+"""
+import subprocess
+import sys
+from collections import defaultdict
+from .config import PROJECT_ROOT
+
+# ============================================================
+# Settings
+# ============================================================
+
+# Modules measured by default (main entry point + each pipeline stage)
+DEFAULT_MODULES = [
+    "main",
+    "src.news_crawler",
+    "src.news_summarize",
+    "src.ailab_summarize",
+    "src.ppt_maker",
+]
+
+
+# ============================================================
+# Utility Functions
+# ============================================================
+
+# Run `python -X importtime -c "import <module>"` in a fresh interpreter and return stderr lines
+def run_importtime(module: str) -> list:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    return proc.stderr.splitlines()
+
+
+# Parse importtime lines and sum self time (us) per top-level package
+def summarize_import_lines(lines: list) -> dict:
+    totals = defaultdict(int)
+    for line in lines:
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        # Format: "import time: <self us> | <cumulative us> | <indented module name>"
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        package = parts[2].strip().split(".")[0]
+        totals[package] += int(parts[0].strip())
+    return dict(totals)
+
+
+# ============================================================
+# Main Function
+# ============================================================
+
+# Print per-module import time report (top_n packages for each measured module)
+def print_startup_report(modules: list = None, top_n: int = 10):
+    modules = modules or DEFAULT_MODULES
+
+    print("\n" + "="*60)
+    print("⏱️ Startup import time report (python -X importtime)")
+    print("="*60)
+
+    for module in modules:
+        totals = summarize_import_lines(run_importtime(module))
+        total_ms = sum(totals.values()) / 1000
+
+        print(f"\n📦 import {module}: 총 {total_ms:.1f} ms")
+        ranked = sorted(totals.items(), key=lambda x: x[1], reverse=True)[:top_n]
+        for package, us in ranked:
+            print(f"    {package:<25} {us / 1000:8.1f} ms")
+
+
+# Test (If needed)
+if __name__ == "__main__":
+    print_startup_report()
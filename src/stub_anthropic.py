@@ -0,0 +1,185 @@
+"""
+Local stub of the Anthropic Messages API for benchmarks.
+
+Serves POST /v1/messages (plain JSON or streaming SSE) with canned
+[Title]/[Summary]/[Insight] output and configurable latency, output speed
+(tokens/sec) and 429 injection, so the full pipeline can be timed without
+spending API credits.
+"""
+import json
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# ============================================================
+# Settings
+# ============================================================
+
+@dataclass
+class StubConfig:
+    latency: float = 0.5 # seconds before the first token
+    tokens_per_sec: float = 80.0 # output speed (0 = instant)
+    output_tokens: int = 200 # output tokens per response (capped by max_tokens)
+    rate_limit_every: int = 0 # every N-th request gets a 429 (0 = never)
+    retry_after: float = 0.2 # seconds sent in the retry-after header of a 429
+
+
+CANNED_RESPONSE = """[Title]
+{title}
+
+[Summary1]
+벤치마크용 스텁 응답으로 생성된 첫 번째 요약 문장임
+
+[Summary2]
+벤치마크용 스텁 응답으로 생성된 두 번째 요약 문장임
+
+[Insight]
+당사는 스텁 응답을 활용하여 파이프라인 성능을 비용 없이 측정할 수 있음"""
+
+TITLE_RE = re.compile(r"<original_title>\s*(.+)")
+
+
+# ============================================================
+# Server
+# ============================================================
+class _Handler(BaseHTTPRequestHandler):
+    server_version = "StubAnthropic/1.0"
+
+    def log_message(self, format, *args):
+        pass # keep benchmark output clean
+
+    def _send_json(self, status: int, body: dict, headers: dict = None):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        if not self.path.startswith("/v1/messages"):
+            self._send_json(404, {"type": "error", "error": {"type": "not_found_error", "message": self.path}})
+            return
+
+        length = int(self.headers.get("content-length", 0))
+        request = json.loads(self.rfile.read(length) or b"{}")
+        stub = self.server.stub
+        cfg = stub.config
+
+        with stub.lock:
+            stub.requests += 1
+            count = stub.requests
+
+        if cfg.rate_limit_every and count % cfg.rate_limit_every == 0:
+            with stub.lock:
+                stub.rate_limited += 1
+            self._send_json(
+                429,
+                {"type": "error", "error": {"type": "rate_limit_error", "message": "stub rate limit"}},
+                headers={"retry-after": str(cfg.retry_after)},
+            )
+            return
+
+        prompt = " ".join(
+            m["content"] if isinstance(m["content"], str) else json.dumps(m["content"], ensure_ascii=False)
+            for m in request.get("messages", [])
+        )
+        title_match = TITLE_RE.search(prompt)
+        text = CANNED_RESPONSE.format(title=title_match.group(1).strip() if title_match else "벤치마크 스텁 제목")
+
+        output_tokens = min(cfg.output_tokens, request.get("max_tokens", cfg.output_tokens))
+        stop_reason = "max_tokens" if output_tokens < cfg.output_tokens else "end_turn"
+        generation_time = output_tokens / cfg.tokens_per_sec if cfg.tokens_per_sec else 0.0
+        message = {
+            "id": f"msg_stub_{uuid.uuid4().hex[:24]}",
+            "type": "message",
+            "role": "assistant",
+            "model": request.get("model", "stub"),
+            "content": [{"type": "text", "text": text}],
+            "stop_reason": stop_reason,
+            "stop_sequence": None,
+            "usage": {"input_tokens": max(1, len(prompt) // 4), "output_tokens": output_tokens},
+        }
+
+        time.sleep(cfg.latency)
+        if request.get("stream"):
+            self._send_stream(message, generation_time)
+        else:
+            time.sleep(generation_time)
+            self._send_json(200, message)
+
+    # Server-sent events in the Messages streaming format, text split over the generation time
+    def _send_stream(self, message: dict, generation_time: float, chunks: int = 8):
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("cache-control", "no-cache")
+        self.end_headers()
+
+        def send(event: str, data: dict):
+            self.wfile.write(f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        text = message["content"][0]["text"]
+        start = {**message, "content": [], "stop_reason": None,
+                 "usage": {"input_tokens": message["usage"]["input_tokens"], "output_tokens": 1}}
+        send("message_start", {"type": "message_start", "message": start})
+        send("content_block_start", {"type": "content_block_start", "index": 0,
+                                     "content_block": {"type": "text", "text": ""}})
+        step = max(1, -(-len(text) // chunks))
+        for i in range(0, len(text), step):
+            send("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                         "delta": {"type": "text_delta", "text": text[i:i + step]}})
+            time.sleep(generation_time / chunks)
+        send("content_block_stop", {"type": "content_block_stop", "index": 0})
+        send("message_delta", {"type": "message_delta",
+                               "delta": {"stop_reason": message["stop_reason"], "stop_sequence": None},
+                               "usage": {"output_tokens": message["usage"]["output_tokens"]}})
+        send("message_stop", {"type": "message_stop"})
+
+
+class StubAnthropicServer:
+    def __init__(self, config: StubConfig = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or StubConfig()
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.rate_limited = 0
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubAnthropicServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# Test (If needed)
+if __name__ == "__main__":
+    with StubAnthropicServer() as server:
+        print(f"Stub Anthropic API: {server.base_url} (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,188 @@
+"""
+Telemetry for Claude calls: tokens, latency, time-to-first-token, retries and cost.
+
+Every call made through create_message() appends one JSON line to
+output/telemetry/<run_id>.jsonl. print_telemetry_report() aggregates the
+files (percentiles, cost per run, truncated responses).
+"""
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from .config import TELEMETRY_DIR
+
+# ============================================================
+# Settings
+# ============================================================
+
+# USD per 1M tokens: (input, output, cache write, cache read)
+MODEL_PRICING = {
+    "claude-sonnet-4-6": (3.00, 15.00, 3.75, 0.30),
+    "claude-sonnet-4-5": (3.00, 15.00, 3.75, 0.30),
+    "claude-haiku-4-5": (1.00, 5.00, 1.25, 0.10),
+    "claude-opus-4-1": (15.00, 75.00, 18.75, 1.50),
+}
+
+BENCHMARK_PREFIX = "bench_" # run ids of benchmark.py (stub API)
+
+_lock = threading.Lock()
+_run_id = None
+
+
+# All calls until the next set_run_id() are written to output/telemetry/<run_id>.jsonl
+def set_run_id(run_id: str):
+    global _run_id
+    _run_id = run_id
+
+
+def get_run_id() -> str:
+    global _run_id
+    if _run_id is None:
+        _run_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return _run_id
+
+
+def estimate_cost(model: str, input_tokens: int, output_tokens: int,
+                  cache_write_tokens: int = 0, cache_read_tokens: int = 0):
+    prices = next((p for name, p in MODEL_PRICING.items() if model.startswith(name)), None)
+    if prices is None:
+        return None
+    tokens = (input_tokens, output_tokens, cache_write_tokens, cache_read_tokens)
+    return round(sum(t * p for t, p in zip(tokens, prices)) / 1_000_000, 6)
+
+
+def record(entry: dict):
+    entry = {"ts": datetime.now().isoformat(), "run_id": get_run_id(), **entry}
+    path = Path(TELEMETRY_DIR) / f"{entry['run_id']}.jsonl"
+    with _lock:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+# ============================================================
+# Instrumented Call
+# ============================================================
+
+# client.messages.create() replacement: streams the response to measure time-to-first-token,
+# records usage/latency/retries/cost and returns the final Message
+def create_message(client, caller: str, **kwargs):
+    model = kwargs.get("model", "")
+    start = time.perf_counter()
+    ttft = None
+    retries = 0
+
+    try:
+        with client.messages.stream(**kwargs) as stream:
+            retries = int(stream.response.request.headers.get("x-stainless-retry-count", 0) or 0)
+            for event in stream:
+                if ttft is None and event.type == "content_block_delta":
+                    ttft = time.perf_counter() - start
+            message = stream.get_final_message()
+    except Exception as e:
+        record({
+            "caller": caller,
+            "model": model,
+            "latency_s": round(time.perf_counter() - start, 4),
+            "error": f"{type(e).__name__}: {e}",
+        })
+        raise
+
+    usage = message.usage
+    input_tokens = usage.input_tokens or 0
+    output_tokens = usage.output_tokens or 0
+    cache_write = getattr(usage, "cache_creation_input_tokens", None) or 0
+    cache_read = getattr(usage, "cache_read_input_tokens", None) or 0
+
+    record({
+        "caller": caller,
+        "model": message.model or model,
+        "stop_reason": message.stop_reason,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "cache_creation_input_tokens": cache_write,
+        "cache_read_input_tokens": cache_read,
+        "latency_s": round(time.perf_counter() - start, 4),
+        "ttft_s": round(ttft, 4) if ttft is not None else None,
+        "retries": retries,
+        "max_tokens": kwargs.get("max_tokens"),
+        "cost_usd": estimate_cost(message.model or model, input_tokens, output_tokens, cache_write, cache_read),
+    })
+    return message
+
+
+# ============================================================
+# Aggregate Report
+# ============================================================
+
+# run_ids: files to aggregate; by default every real run (benchmark runs against the stub API,
+# BENCHMARK_PREFIX*, are left out so fake costs and latencies do not mix into the percentiles)
+def load_records(run_ids: list = None) -> list:
+    files = sorted(Path(TELEMETRY_DIR).glob("*.jsonl"))
+    if run_ids:
+        files = [f for f in files if f.stem in run_ids]
+    else:
+        files = [f for f in files if not f.stem.startswith(BENCHMARK_PREFIX)]
+
+    records = []
+    for path in files:
+        with open(path, "r", encoding="utf-8") as f:
+            records.extend(json.loads(line) for line in f if line.strip())
+    return records
+
+
+def percentile(values: list, pct: float):
+    if not values:
+        return None
+    values = sorted(values)
+    k = (len(values) - 1) * pct / 100
+    lower, upper = int(k), min(int(k) + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (k - lower)
+
+
+def print_telemetry_report(run_ids: list = None):
+    records = load_records(run_ids)
+    if not records:
+        print(f"⚠️ 텔레메트리 기록이 없습니다: {TELEMETRY_DIR}")
+        return
+    if not run_ids:
+        print(f"ℹ️ 벤치마크 실행({BENCHMARK_PREFIX}*)은 제외됩니다. 보려면 Run ID를 지정하세요.")
+
+    ok = [r for r in records if "error" not in r]
+
+    print("\n" + "="*60)
+    print("📡 Claude 호출 텔레메트리")
+    print("="*60)
+
+    # Per run totals
+    runs = {}
+    for r in records:
+        runs.setdefault(r["run_id"], []).append(r)
+    print(f"\n{'run_id':<26} {'calls':>5} {'errors':>6} {'input':>8} {'output':>8} {'cache_r':>8} {'cost($)':>9}")
+    for run_id, items in runs.items():
+        done = [r for r in items if "error" not in r]
+        cost = sum(r.get("cost_usd") or 0 for r in done)
+        print(f"{run_id:<26} {len(items):>5} {len(items) - len(done):>6} "
+              f"{sum(r['input_tokens'] for r in done):>8} {sum(r['output_tokens'] for r in done):>8} "
+              f"{sum(r['cache_read_input_tokens'] for r in done):>8} {cost:>9.4f}")
+
+    # Percentiles across runs
+    print(f"\n{'metric':<12} {'p50':>8} {'p90':>8} {'p99':>8} {'max':>8}")
+    for label, key in [("latency_s", "latency_s"), ("ttft_s", "ttft_s"), ("output_tok", "output_tokens")]:
+        values = [r[key] for r in ok if r.get(key) is not None]
+        if values:
+            p50, p90, p99 = (percentile(values, p) for p in (50, 90, 99))
+            print(f"{label:<12} {p50:>8.2f} {p90:>8.2f} {p99:>8.2f} {max(values):>8.2f}")
+
+    retried = sum(1 for r in ok if r.get("retries"))
+    print(f"\n🔁 재시도가 발생한 호출: {retried}/{len(ok)}")
+
+    # Truncated responses
+    truncated = [r for r in ok if r.get("stop_reason") == "max_tokens"]
+    if truncated:
+        print(f"\n✂️ max_tokens로 잘린 응답 {len(truncated)}건:")
+        for r in truncated:
+            print(f"   {r['run_id']} {r['caller']:<16} output {r['output_tokens']}/{r.get('max_tokens')} tokens")
+    else:
+        print("\n✅ max_tokens로 잘린 응답 없음")
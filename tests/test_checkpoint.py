@@ -0,0 +1,86 @@
+"""
+Resume checks of the pipeline with a RunStore: which stages are loaded from the
+checkpoint and which run again.
+"""
+import pytest
+
+from src import checkpoint
+from src.checkpoint import RunStore
+from src.pipeline import Stage, run_pipeline
+
+
+@pytest.fixture(autouse=True)
+def runs_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(checkpoint, "RUNS_DIR", tmp_path / "runs")
+
+
+# Two stages, "source" -> "report"; calls records which stages actually ran
+def make_stages(calls: list, inputs: dict):
+    def source(results):
+        calls.append("source")
+        return inputs["value"]
+
+    def report(results):
+        calls.append("report")
+        if inputs.get("fail"):
+            raise RuntimeError("report failed")
+        return f"report of {results['source']}"
+
+    return [
+        Stage("source", source, fingerprint=lambda: inputs["fingerprint"]),
+        Stage("report", report, deps=["source"]),
+    ]
+
+
+def run(store, calls, inputs):
+    return run_pipeline(make_stages(calls, inputs), report=False, store=store)
+
+
+def test_unchanged_run_is_loaded_from_checkpoint():
+    store = RunStore()
+    inputs = {"value": "a", "fingerprint": "f1"}
+    run(store, [], inputs)
+
+    calls = []
+    results = run(RunStore.open(store.run_id), calls, inputs)
+    assert calls == []
+    assert results["report"] == "report of a"
+
+
+def test_changed_fingerprint_reruns_stage():
+    store = RunStore()
+    run(store, [], {"value": "a", "fingerprint": "f1"})
+
+    # Same output after the re-run: the dependent stage is still loaded
+    calls = []
+    run(RunStore.open(store.run_id), calls, {"value": "a", "fingerprint": "f2"})
+    assert calls == ["source"]
+
+
+def test_changed_dependency_output_reruns_dependent():
+    store = RunStore()
+    run(store, [], {"value": "a", "fingerprint": "f1"})
+
+    calls = []
+    results = run(RunStore.open(store.run_id), calls, {"value": "b", "fingerprint": "f2"})
+    assert calls == ["source", "report"]
+    assert results["report"] == "report of b"
+
+
+def test_failed_stage_reruns_on_resume():
+    store = RunStore()
+    with pytest.raises(RuntimeError):
+        run(store, [], {"value": "a", "fingerprint": "f1", "fail": True})
+    assert store.manifest["stages"]["report"]["status"] == "failed"
+
+    calls = []
+    results = run(RunStore.open(store.run_id), calls, {"value": "a", "fingerprint": "f1"})
+    assert calls == ["report"]
+    assert results["report"] == "report of a"
+
+
+def test_runs_started_in_the_same_second_do_not_share_a_directory():
+    first, second = RunStore("20251230_090000"), RunStore("20251230_090000")
+    assert first.run_id == "20251230_090000"
+    assert second.run_id == "20251230_090000_2"
+    assert second.manifest["stages"] == {}
@@ -0,0 +1,94 @@
+"""
+Sharded crawl must pick the same articles as the serial crawl, also when
+several queries return the same URLs.
+"""
+from types import SimpleNamespace
+
+import pytest
+
+from src import crawl_shards, news_crawler
+from src.news_crawler import CrawlerConfig
+
+# u0 and u5 score high: the first query picks u0, the second one must then find u5
+SCORES = {"u0": "출시 서비스 챗봇", "u5": "출시 서비스", "u6": "출시"}
+CATEGORIES = [{"category": "보험사", "queries": ["A", "B"]}]
+
+
+@pytest.fixture
+def fake_feed(monkeypatch):
+    def parse(url):
+        count = 8 if "q=C" in url else 6
+        entries = [SimpleNamespace(title=f"기사 u{i}", link=f"u{i}", published="") for i in range(count)]
+        return SimpleNamespace(entries=entries)
+
+    monkeypatch.setattr(news_crawler, "feedparser", SimpleNamespace(parse=parse))
+    monkeypatch.setattr(news_crawler, "setup_ssl", lambda: None)
+    monkeypatch.setattr(news_crawler, "decode_url", lambda link: link)
+    monkeypatch.setattr(news_crawler, "fetch_article", lambda url, config: f"{url} {SCORES.get(url, '')}")
+
+
+def crawl_both(tmp_path, categories, num_shards=2):
+    cfg = CrawlerConfig(max_total=10, skip_reported=False)
+    serial = news_crawler.crawl_news(cfg, categories=categories)
+
+    db = tmp_path / "queue.sqlite3"
+    crawl_shards.create_queue(db, cfg, categories, num_shards)
+    crawl_shards.run_worker(db, "test-worker")
+    return serial, crawl_shards.merge_results(db)
+
+
+def test_overlapping_queries_match_serial(fake_feed, tmp_path):
+    serial, sharded = crawl_both(tmp_path, CATEGORIES)
+    assert list(serial["link"]) == ["u0", "u5"]
+    assert list(sharded["link"]) == list(serial["link"])
+
+
+# Without slack the second query has only 4 unseen candidates left and is crawled again
+def test_overlap_beyond_slack_is_recrawled(fake_feed, tmp_path, monkeypatch):
+    monkeypatch.setattr(crawl_shards, "OVERLAP_SLACK", 0)
+    categories = [{"category": "보험사", "queries": ["A", "B", "C"]}]
+    serial, sharded = crawl_both(tmp_path, categories, num_shards=3)
+    assert list(serial["link"]) == ["u0", "u5", "u6"]
+    assert list(sharded["link"]) == list(serial["link"])
+
+
+def test_stale_claim_is_rejected(tmp_path):
+    cfg = CrawlerConfig(skip_reported=False)
+    db = tmp_path / "queue.sqlite3"
+    crawl_shards.create_queue(db, cfg, CATEGORIES, 1)
+
+    conn = crawl_shards.connect(db)
+    try:
+        stale = crawl_shards.claim_shard(conn, "old-worker")
+        crawl_shards.create_queue(db, cfg, CATEGORIES, 1) # queue re-created while the shard was running
+        assert not crawl_shards.complete_shard(conn, stale, "old-worker", {})
+
+        claim = crawl_shards.claim_shard(conn, "new-worker")
+        assert not crawl_shards.complete_shard(conn, claim, "old-worker", {})
+        assert crawl_shards.complete_shard(conn, claim, "new-worker", {})
+    finally:
+        conn.close()
+    assert crawl_shards.queue_status(db)["done"] == 1
+
+
+def test_renewed_lease_is_not_taken_over(tmp_path, monkeypatch):
+    cfg = CrawlerConfig(skip_reported=False)
+    db = tmp_path / "queue.sqlite3"
+    crawl_shards.create_queue(db, cfg, CATEGORIES, 1)
+    clock = [1000.0]
+    monkeypatch.setattr(crawl_shards.time, "time", lambda: clock[0])
+
+    conn = crawl_shards.connect(db)
+    try:
+        slow = crawl_shards.claim_shard(conn, "slow-worker", lease=10)
+        clock[0] += 8
+        assert crawl_shards.renew_lease(conn, slow, "slow-worker")
+        clock[0] += 8 # 16s after the claim, 8s after the last heartbeat
+        assert crawl_shards.claim_shard(conn, "other-worker", lease=10) is None
+
+        clock[0] += 8 # no heartbeat for 16s: the shard is handed over
+        assert crawl_shards.claim_shard(conn, "other-worker", lease=10) is not None
+        assert not crawl_shards.renew_lease(conn, slow, "slow-worker")
+        assert not crawl_shards.complete_shard(conn, slow, "slow-worker", {})
+    finally:
+        conn.close()
@@ -0,0 +1,24 @@
+"""
+history --rebuild must only use selections that were published.
+"""
+import pandas as pd
+
+from src import history
+
+
+def test_rebuild_skips_scratch_selection(tmp_path, monkeypatch):
+    monkeypatch.setattr(history, "OUTPUT_DIR", tmp_path)
+    monkeypatch.setattr(history, "RUNS_DIR", tmp_path / "runs")
+    monkeypatch.setattr(history, "SELECTED_NEWS_FILE", tmp_path / "selected_news.xlsx")
+
+    def article(url):
+        return {"link": url, "title": f"기사 {url}", "company": "삼성화재", "content": f"본문 {url}"}
+
+    # Written at selection time by a run that never reached the PPT
+    pd.DataFrame([article("unpublished")]).to_excel(tmp_path / "selected_news.xlsx", index=False)
+    # Published rows of an edition
+    pd.DataFrame([article("edition")]).to_excel(tmp_path / "selected_news_보험_20251230_090000.xlsx", index=False)
+
+    db = tmp_path / "reported.sqlite3"
+    assert history.rebuild_index(db_path=db) == 1
+    assert history.load_reported_keys(db)["urls"] == {"edition"}
@@ -0,0 +1,44 @@
+"""
+The streaming XML writer must produce a valid PPTX (CRCs, python-pptx), also
+when several threads render from the same cached template.
+"""
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pptx import Presentation
+
+from src import ppt_maker
+from src.config import PPT_TEMPLATE_FILE
+
+NEWS = "[Title] 테스트 제목\n[Summary1] 요약1 내용\n[Summary2] 요약2 내용\n[Insight] 인사이트 내용"
+AILAB = "[Title] AI Lab 테스트\n[Summary1] AI Lab 요약1\n[Summary2] AI Lab 요약2"
+
+
+def check_report(path, number: str):
+    with zipfile.ZipFile(path) as zf:
+        assert zf.testzip() is None
+    texts = [shape.text_frame.text for shape in Presentation(str(path)).slides[0].shapes if shape.has_text_frame]
+    assert any(number in text for text in texts)
+    assert any("테스트 제목" in text for text in texts)
+
+
+@pytest.mark.parametrize("raw_copy", [True, False])
+def test_xml_writer_round_trip(tmp_path, monkeypatch, raw_copy):
+    monkeypatch.setattr(ppt_maker, "RAW_COPY_SUPPORTED", raw_copy)
+    monkeypatch.setattr(ppt_maker, "_template_cache", {})
+    out = tmp_path / "report.pptx"
+    ppt_maker.create_report(str(PPT_TEMPLATE_FILE), str(out), "26", "2025년 12월 30일", NEWS, AILAB)
+    check_report(out, "26")
+
+
+def test_xml_writer_is_thread_safe(tmp_path):
+    def render(i):
+        out = tmp_path / f"report_{i}.pptx"
+        ppt_maker.create_report(str(PPT_TEMPLATE_FILE), str(out), str(i), "2025년 12월 30일", NEWS, AILAB)
+        return out, str(i)
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        reports = list(executor.map(render, range(60)))
+    for out, number in reports:
+        check_report(out, number)